@@ -24,26 +24,37 @@ function App() {
       setConnected(true)
     }
     
+    const handleUpdate = (message) => {
+      if (message.type !== 'update') {
+        return
+      }
+      
+      setDetections(message.detections || [])
+      setTracks(message.tracks || [])
+      setSystemStatus(message.system_status)
+      
+      // Update data rate history
+      if (message.system_status) {
+        setDataRateHistory(prev => {
+          const newHistory = [...prev, {
+            time: new Date(message.timestamp),
+            rate: message.system_status.data_rate_hz,
+            tracks: message.system_status.active_tracks
+          }]
+          // Keep last 100 points
+          return newHistory.slice(-100)
+        })
+      }
+    }
+    
     ws.onmessage = (event) => {
       const message = JSON.parse(event.data)
       
-      if (message.type === 'update') {
-        setDetections(message.detections || [])
-        setTracks(message.tracks || [])
-        setSystemStatus(message.system_status)
-        
-        // Update data rate history
-        if (message.system_status) {
-          setDataRateHistory(prev => {
-            const newHistory = [...prev, {
-              time: new Date(message.timestamp),
-              rate: message.system_status.data_rate_hz,
-              tracks: message.system_status.active_tracks
-            }]
-            // Keep last 100 points
-            return newHistory.slice(-100)
-          })
-        }
+      // Frames queued for a slow connection arrive coalesced in one batch
+      if (message.type === 'batch') {
+        message.frames.forEach(handleUpdate)
+      } else {
+        handleUpdate(message)
       }
     }
     
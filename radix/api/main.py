@@ -2,19 +2,22 @@
 FastAPI main application for RADIX
 """
 import asyncio
-import json
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from itertools import islice
+from typing import List, Dict, Any, Callable, Deque, Hashable
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
 import numpy as np
+import orjson
+from pydantic import TypeAdapter
 
 from ..models.schemas import (
     RadarConfig, RadarType, NormalizedRadarData, 
     TargetTrack, SystemStatus, MLDataset
 )
-from ..simulators.base import Target
+from ..simulators.base import Target, TargetSet, simulate_all
 from ..simulators.fmcw_simulator import FMCWRadarSimulator
 from ..simulators.pulse_doppler_simulator import PulseDopplerRadarSimulator
 from ..simulators.aesa_simulator import AESARadarSimulator
@@ -23,10 +26,46 @@ from ..core.tracker import SimpleTracker
 from ..core.extractor import DataExtractor
 
 
+# Number of normalized detections kept in memory
+MAX_DETECTION_HISTORY = 1000
+# Detection tail lengths cached per frame by /api/detections
+DETECTION_LIMIT_BUCKETS = (100, 250, 500, MAX_DETECTION_HISTORY)
+
+# Detection rate above which WebSocket frames are sent every other frame
+BROADCAST_THROTTLE_HZ = 500.0
+
+# Frames buffered per WebSocket client before the oldest is dropped
+CLIENT_QUEUE_SIZE = 16
+
+
+# Naive datetimes are UTC (datetime.utcnow()); numpy values serialize natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _orjson_default(obj):
+    """Serialize types orjson does not handle natively (pandas.Timestamp)"""
+    if hasattr(obj, "to_pydatetime"):
+        return obj.to_pydatetime()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON with the API-wide orjson options"""
+    return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """JSON response rendered by orjson with the API-wide options"""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 app = FastAPI(
     title="RADIX API",
     description="Radar Data Integration & eXtraction Framework",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
@@ -39,23 +78,122 @@ app.add_middleware(
 )
 
 
+class ClientChannel:
+    """
+    Outbound queue and writer task for one WebSocket client
+    
+    The simulation loop only enqueues payloads; a dedicated writer task
+    drains the queue, so a slow client cannot stall the producer. Frames
+    that pile up while a send is in flight are delivered together as one
+    {"type": "batch", "frames": [...]} message.
+    """
+    
+    def __init__(self, websocket: WebSocket, maxsize: int = CLIENT_QUEUE_SIZE):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.writer = asyncio.create_task(self._write())
+    
+    def publish(self, payload: str):
+        """Queue a payload, dropping the oldest one if the client is behind"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(payload)
+    
+    async def _write(self):
+        try:
+            while True:
+                frames = [await self.queue.get()]
+                
+                # Coalesce everything queued while the last send was in flight
+                while not self.queue.empty():
+                    frames.append(self.queue.get_nowait())
+                
+                if len(frames) == 1:
+                    payload = frames[0]
+                else:
+                    payload = '{"type":"batch","frames":[' + ",".join(frames) + "]}"
+                await self.websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Send failed, client is gone
+            state.clients.pop(self.websocket, None)
+    
+    def close(self):
+        """Stop the writer task"""
+        self.writer.cancel()
+
+
 # Global state
 class RADIXState:
     def __init__(self):
         self.simulators: Dict[str, Any] = {}
+        # Simulated targets, shared by every simulator
+        self.targets = TargetSet()
         self.normalizer = DataNormalizer()
         self.tracker = SimpleTracker()
         self.extractor = DataExtractor()
-        self.all_detections: List[NormalizedRadarData] = []
-        self.active_websockets: List[WebSocket] = []
+        # Recent detection history, bounded to the last MAX_DETECTION_HISTORY
+        self.all_detections: Deque[NormalizedRadarData] = deque(maxlen=MAX_DETECTION_HISTORY)
+        self.clients: Dict[WebSocket, ClientChannel] = {}
         self.simulation_running = False
         self.start_time = datetime.utcnow()
         self.total_detections = 0
+        self.frame_count = 0
+        # Confirmed/coasting tracks, refreshed once per simulation frame
+        self.active_tracks: List[TargetTrack] = []
         self.data_rate_hz = 0.0
+        # Rendered/serialized GET responses, valid for the frame they were built in
+        self.response_cache: Dict[Hashable, Any] = {}
+        self.response_cache_frame = -1
 
 
 state = RADIXState()
 
+# Placeholder ENU position for detections without one (serialized as null)
+_NO_POSITION = (np.nan, np.nan, np.nan)
+
+
+def cached_render(key: Hashable, render: Callable[[], Any]) -> Any:
+    """
+    Build a value at most once per simulation frame
+    
+    The cache is dropped as soon as the frame counter advances.
+    """
+    if state.response_cache_frame != state.frame_count:
+        state.response_cache.clear()
+        state.response_cache_frame = state.frame_count
+    
+    value = state.response_cache.get(key)
+    if value is None:
+        value = state.response_cache[key] = render()
+    return value
+
+
+def cached_json(key: Hashable, render: Callable[[], Any]) -> Response:
+    """
+    Serve a JSON body rendered at most once per simulation frame
+    
+    Polling clients share the bytes serialized for the current frame instead
+    of rebuilding and encoding the payload on every request.
+    """
+    body = cached_render(("json", key), lambda: dumps(render()))
+    return Response(content=body, media_type="application/json")
+
+
+# Converter for the dataset listing (pydantic-core, no jsonable_encoder pass)
+_DATASET_LIST = TypeAdapter(List[MLDataset])
+
+
+def model_response(content: Any) -> Response:
+    """
+    Response for data already dumped by pydantic (model_dump / dump_python)
+    
+    Encoded with dumps() so timestamps carry the same explicit UTC offset
+    as every other endpoint.
+    """
+    return Response(content=dumps(content), media_type="application/json")
+
 
 def create_radar_simulator(config: RadarConfig):
     """Factory for creating radar simulators"""
@@ -101,68 +239,62 @@ def initialize_simulation():
         simulator = create_radar_simulator(config)
         state.simulators[config.id] = simulator
     
-    # Create simulated targets
-    np.random.seed(42)
-    for i in range(10):
-        # Random position
-        position = np.array([
-            np.random.uniform(-5000, 5000),  # x
-            np.random.uniform(1000, 8000),   # y (forward)
-            np.random.uniform(50, 500)       # z (altitude)
-        ])
-        
-        # Random velocity
-        velocity = np.array([
-            np.random.uniform(-50, 50),      # vx
-            np.random.uniform(-30, 30),      # vy
-            np.random.uniform(-5, 5)         # vz
-        ])
-        
-        # Random RCS
-        rcs = np.random.uniform(0, 20)
-        
-        target = Target(i, position, velocity, rcs)
-        
-        # Add target to all simulators
-        for simulator in state.simulators.values():
-            simulator.add_target(target)
+    # Create simulated targets, kinematic state held in one shared TargetSet;
+    # each attribute is drawn for all targets in one call
+    rng = np.random.default_rng(42)
+    num_targets = 10
+    positions = rng.uniform(
+        [-5000, 1000, 50],   # x, y (forward), z (altitude)
+        [5000, 8000, 500],
+        (num_targets, 3)
+    )
+    velocities = rng.uniform([-50, -30, -5], [50, 30, 5], (num_targets, 3))
+    rcs = rng.uniform(0, 20, num_targets)
+    
+    targets = TargetSet(
+        Target(i, positions[i], velocities[i], rcs[i].item())
+        for i in range(num_targets)
+    )
+    
+    # All simulators observe the same targets
+    for simulator in state.simulators.values():
+        simulator.targets = targets
+    state.targets = targets
+
+
+def broadcast(payload: str):
+    """Queue a pre-serialized payload for every connected client"""
+    for channel in list(state.clients.values()):
+        channel.publish(payload)
 
 
 async def simulation_loop():
     """Main simulation loop"""
     dt = 0.1  # 100ms update interval
-    frame_count = 0
     last_rate_update = datetime.utcnow()
     detections_since_last = 0
     
     while state.simulation_running:
         current_time = datetime.utcnow()
         
-        # Update all targets
-        for simulator in state.simulators.values():
-            simulator.update_targets(dt)
+        # Update all targets (shared by every simulator) in one vectorized step
+        state.targets.update(dt)
         
         # Generate detections from all radars
-        all_raw_detections = []
-        for simulator in state.simulators.values():
-            raw_detections = simulator.simulate_frame(current_time)
-            all_raw_detections.extend(raw_detections)
+        all_raw_detections = simulate_all(state.simulators.values(), current_time)
         
         # Normalize detections
         normalized_detections = state.normalizer.batch_normalize(all_raw_detections)
-        state.all_detections.extend(normalized_detections)
+        state.all_detections.extend(normalized_detections)  # deque evicts the oldest
         state.total_detections += len(normalized_detections)
         detections_since_last += len(normalized_detections)
         
-        # Keep only recent detections in memory (last 1000)
-        if len(state.all_detections) > 1000:
-            state.all_detections = state.all_detections[-1000:]
-        
         # Update tracks
         if normalized_detections:
             tracks = state.tracker.update(normalized_detections)
         else:
             tracks = list(state.tracker.tracks.values())
+        state.active_tracks = state.tracker.get_active_tracks()
         
         # Calculate data rate
         time_diff = (current_time - last_rate_update).total_seconds()
@@ -171,58 +303,67 @@ async def simulation_loop():
             detections_since_last = 0
             last_rate_update = current_time
         
-        # Broadcast to WebSocket clients
-        if state.active_websockets:
+        # Broadcast to WebSocket clients, every other frame under heavy detection load
+        broadcast_stride = 2 if state.data_rate_hz > BROADCAST_THROTTLE_HZ else 1
+        if state.clients and state.frame_count % broadcast_stride == 0:
+            shown = normalized_detections[:50]  # Limit to 50 per frame
+            
+            # Round all numeric fields with one ufunc call per table
+            det_values = np.round(np.array(
+                [
+                    [d.range_m, d.azimuth_deg, d.elevation_deg or 0, d.doppler_mps, d.snr_db,
+                     *(d.position_enu or _NO_POSITION)]
+                    for d in shown
+                ],
+                dtype=np.float64
+            ).reshape(-1, 8), 2).tolist()
+            track_values = np.round(np.array(
+                [t.state_vector[:6] for t in tracks], dtype=np.float64
+            ).reshape(-1, 6), 2).tolist()
+            
             message = {
                 "type": "update",
-                "timestamp": current_time.isoformat(),
+                "timestamp": current_time,
                 "detections": [
                     {
                         "sensor_id": d.sensor_id,
                         "target_id": d.target_id,
-                        "range_m": round(d.range_m, 2),
-                        "azimuth_deg": round(d.azimuth_deg, 2),
-                        "elevation_deg": round(d.elevation_deg or 0, 2),
-                        "doppler_mps": round(d.doppler_mps, 2),
-                        "snr_db": round(d.snr_db, 2),
-                        "position_enu": [round(p, 2) for p in d.position_enu] if d.position_enu else None,
+                        "range_m": row[0],
+                        "azimuth_deg": row[1],
+                        "elevation_deg": row[2],
+                        "doppler_mps": row[3],
+                        "snr_db": row[4],
+                        "position_enu": row[5:] if d.position_enu else None,
                         "track_state": d.track_state.value if d.track_state else None
                     }
-                    for d in normalized_detections[:50]  # Limit to 50 per frame
+                    for d, row in zip(shown, det_values)
                 ],
                 "tracks": [
                     {
                         "track_id": t.track_id,
                         "sensor_id": t.sensor_id,
-                        "position": [round(t.state_vector[i], 2) for i in range(3)],
-                        "velocity": [round(t.state_vector[i], 2) for i in range(3, 6)],
+                        "position": row[:3],
+                        "velocity": row[3:],
                         "track_state": t.track_state.value,
                         "num_detections": len(t.detections)
                     }
-                    for t in tracks
+                    for t, row in zip(tracks, track_values)
                 ],
                 "system_status": {
                     "uptime_seconds": (current_time - state.start_time).total_seconds(),
                     "active_radars": len(state.simulators),
                     "total_detections": state.total_detections,
-                    "active_tracks": len(state.tracker.get_active_tracks()),
+                    "active_tracks": len(state.active_tracks),
                     "data_rate_hz": round(state.data_rate_hz, 2)
                 }
             }
             
-            # Send to all connected clients
-            disconnected = []
-            for ws in state.active_websockets:
-                try:
-                    await ws.send_json(message)
-                except:
-                    disconnected.append(ws)
+            # Serialize once and share the payload across all clients
+            payload = dumps(message).decode()
             
-            # Remove disconnected clients
-            for ws in disconnected:
-                state.active_websockets.remove(ws)
+            broadcast(payload)
         
-        frame_count += 1
+        state.frame_count += 1
         await asyncio.sleep(dt)
 
 
@@ -255,14 +396,15 @@ async def root():
 async def get_status():
     """Get system status"""
     current_time = datetime.utcnow()
-    return SystemStatus(
+    status = SystemStatus(
         uptime_seconds=(current_time - state.start_time).total_seconds(),
         active_radars=len(state.simulators),
         total_detections=state.total_detections,
-        active_tracks=len(state.tracker.get_active_tracks()),
+        active_tracks=len(state.active_tracks),
         data_rate_hz=state.data_rate_hz,
         timestamp=current_time
     )
+    return model_response(status.model_dump())
 
 
 @app.get("/api/radars")
@@ -279,10 +421,7 @@ async def get_radars():
     ]
 
 
-@app.get("/api/tracks")
-async def get_tracks():
-    """Get active tracks"""
-    tracks = state.tracker.get_active_tracks()
+def _render_tracks() -> List[Dict[str, Any]]:
     return [
         {
             "track_id": t.track_id,
@@ -290,21 +429,19 @@ async def get_tracks():
             "position": t.state_vector[:3],
             "velocity": t.state_vector[3:6],
             "track_state": t.track_state.value,
-            "first_seen": t.first_seen.isoformat(),
-            "last_updated": t.last_updated.isoformat(),
+            "first_seen": t.first_seen,
+            "last_updated": t.last_updated,
             "num_detections": len(t.detections)
         }
-        for t in tracks
+        for t in state.active_tracks
     ]
 
 
-@app.get("/api/detections")
-async def get_recent_detections(limit: int = 100):
-    """Get recent detections"""
-    recent = state.all_detections[-limit:]
+def _render_detections(limit: int) -> List[Dict[str, Any]]:
+    recent = islice(state.all_detections, max(0, len(state.all_detections) - limit), None)
     return [
         {
-            "timestamp": d.timestamp.isoformat(),
+            "timestamp": d.timestamp,
             "sensor_id": d.sensor_id,
             "target_id": d.target_id,
             "range_m": d.range_m,
@@ -318,13 +455,32 @@ async def get_recent_detections(limit: int = 100):
     ]
 
 
-@app.get("/api/datasets")
+@app.get("/api/tracks")
+async def get_tracks():
+    """Get active tracks"""
+    return cached_json("tracks", _render_tracks)
+
+
+@app.get("/api/detections")
+async def get_recent_detections(limit: int = 100):
+    """Get recent detections"""
+    limit = min(max(limit, 0), MAX_DETECTION_HISTORY)
+    # Only the bucket sizes are cached, so arbitrary limits cannot grow the
+    # cache; other limits are served from the tail of the next bucket up
+    bucket = next(b for b in DETECTION_LIMIT_BUCKETS if b >= limit)
+    rows = cached_render(("detections", bucket), lambda: _render_detections(bucket))
+    if limit == bucket:
+        return cached_json(("detections", bucket), lambda: rows)
+    return Response(content=dumps(rows[len(rows) - limit:]), media_type="application/json")
+
+
+@app.get("/api/datasets", response_model=List[MLDataset])
 async def get_datasets():
     """Get available ML datasets"""
-    return list(state.extractor.datasets.values())
+    return model_response(_DATASET_LIST.dump_python(list(state.extractor.datasets.values())))
 
 
-@app.post("/api/datasets/create")
+@app.post("/api/datasets/create", response_model=MLDataset)
 async def create_dataset(name: str, description: str, format: str = "tabular"):
     """Create new ML dataset"""
     tracks = list(state.tracker.tracks.values())
@@ -335,47 +491,59 @@ async def create_dataset(name: str, description: str, format: str = "tabular"):
         tracks=tracks,
         format=format
     )
-    return dataset
+    return model_response(dataset.model_dump())
 
 
 @app.get("/api/datasets/{dataset_id}/export")
 async def export_dataset(dataset_id: str, format: str = "csv"):
     """Export dataset in specified format"""
     if dataset_id not in state.extractor.datasets:
-        return JSONResponse(status_code=404, content={"error": "Dataset not found"})
+        return ORJSONResponse(status_code=404, content={"error": "Dataset not found"})
     
     tracks = list(state.tracker.tracks.values())
     
     if format == "tabular":
         df = state.extractor.extract_tabular_dataset(state.all_detections)
-        return JSONResponse(content=df.to_dict(orient="records"))
+        return ORJSONResponse(content=df.to_dict(orient="records"))
     elif format == "sequence":
         df = state.extractor.extract_sequence_dataset(tracks)
-        return JSONResponse(content=df.to_dict(orient="records"))
+        return ORJSONResponse(content=df.to_dict(orient="records"))
     elif format == "graph":
         graph_data = state.extractor.extract_graph_dataset(tracks)
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "nodes": graph_data["nodes"].to_dict(orient="records"),
             "adjacency": graph_data["adjacency"].tolist()
         })
     else:
-        return JSONResponse(status_code=400, content={"error": "Invalid format"})
+        return ORJSONResponse(status_code=400, content={"error": "Invalid format"})
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time data streaming"""
     await websocket.accept()
-    state.active_websockets.append(websocket)
+    state.clients[websocket] = ClientChannel(websocket)
     
     try:
         while True:
             # Keep connection alive
             await websocket.receive_text()
     except WebSocketDisconnect:
-        state.active_websockets.remove(websocket)
+        channel = state.clients.pop(websocket, None)
+        if channel:
+            channel.close()
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Simulation state lives in this process, so run a single worker.
+    # uvloop/httptools come with uvicorn[standard] (uvloop is not available on Windows).
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=1
+    )
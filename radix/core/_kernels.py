@@ -0,0 +1,58 @@
+"""
+Vectorized numeric kernels shared by the core engine
+"""
+import numpy as np
+
+
+def cos_from_sin(s: np.ndarray) -> np.ndarray:
+    """
+    Cosine of an angle in [-90, 90] degrees from its sine
+
+    Uses cos = sqrt(1 - sin^2), which is valid because the cosine is
+    non-negative on that interval (elevation angles). One multiply and a
+    sqrt are much cheaper than a second transcendental for large arrays.
+    """
+    c = np.multiply(s, s)
+    np.subtract(1.0, c, out=c)
+    np.maximum(c, 0.0, out=c)
+    return np.sqrt(c, out=c)
+
+
+def sph_to_enu(
+    range_m: np.ndarray,
+    azimuth_deg: np.ndarray,
+    elevation_deg: np.ndarray,
+    doppler_mps: np.ndarray,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Convert spherical measurements to ENU position and radial velocity
+
+    Returns an (N, 6) float64 array of [x, y, z, vx, vy, vz] rows. Every
+    trig function is evaluated once per element and intermediate results are
+    written into ``out`` (allocated if not given) to avoid temporaries.
+    Elevations are expected within [-90, 90] degrees.
+    """
+    n = len(range_m)
+    if out is None:
+        out = np.empty((n, 6), dtype=np.float64)
+
+    az = np.deg2rad(azimuth_deg)
+    el = np.deg2rad(elevation_deg)
+
+    # Direction cosines of the line of sight
+    east = np.sin(az)
+    north = np.cos(az, out=az)
+    up = np.sin(el, out=el)
+    ce = cos_from_sin(up)
+    np.multiply(east, ce, out=east)
+    np.multiply(north, ce, out=north)
+
+    np.multiply(range_m, east, out=out[:, 0])
+    np.multiply(range_m, north, out=out[:, 1])
+    np.multiply(range_m, up, out=out[:, 2])
+    np.multiply(doppler_mps, east, out=out[:, 3])
+    np.multiply(doppler_mps, north, out=out[:, 4])
+    np.multiply(doppler_mps, up, out=out[:, 5])
+
+    return out
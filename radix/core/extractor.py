@@ -3,9 +3,53 @@ ML-ready dataset extraction
 """
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.spatial import cKDTree
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from ..models.schemas import NormalizedRadarData, TargetTrack, MLDataset
+from .normalizer import NormalizedBatch
+
+
+# Row used for detections without an ENU vector (becomes NaN columns)
+_MISSING_VECTOR = (np.nan, np.nan, np.nan)
+
+# Numeric per-detection columns of the sequence dataset, in column order
+_SEQUENCE_FEATURES = (
+    'x', 'y', 'z', 'vx', 'vy', 'vz',
+    'range_m', 'azimuth_deg', 'elevation_deg', 'doppler_mps', 'snr_db', 'rcs_dbsm'
+)
+_MISSING_SEQUENCE_ROW = (np.nan,) * len(_SEQUENCE_FEATURES)
+
+
+def _feature_columns(detections: List[NormalizedRadarData]) -> Dict[str, np.ndarray]:
+    """Scalar measurement columns shared by the tabular and sequence datasets"""
+    n = len(detections)
+    return {
+        'range_m': np.fromiter((d.range_m for d in detections), dtype=np.float64, count=n),
+        'azimuth_deg': np.fromiter((d.azimuth_deg for d in detections), dtype=np.float64, count=n),
+        'elevation_deg': np.fromiter((d.elevation_deg or 0 for d in detections), dtype=np.float64, count=n),
+        'doppler_mps': np.fromiter((d.doppler_mps for d in detections), dtype=np.float64, count=n),
+        'snr_db': np.fromiter((d.snr_db for d in detections), dtype=np.float64, count=n),
+        'rcs_dbsm': np.fromiter((d.rcs_dbsm or 0 for d in detections), dtype=np.float64, count=n),
+    }
+
+
+def _timestamp_column(timestamps: Sequence[datetime]) -> pd.DatetimeIndex:
+    """
+    Detection timestamps as a datetime64 column
+    
+    Detections of one frame share a timestamp, so only the distinct values
+    are converted and then expanded by index; pandas would otherwise infer
+    and convert every datetime object separately.
+    """
+    index: Dict[datetime, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(t, len(index)) for t in timestamps),
+        dtype=np.intp,
+        count=len(timestamps)
+    )
+    return pd.DatetimeIndex(list(index))[codes]
 
 
 class DataExtractor:
@@ -24,37 +68,56 @@ class DataExtractor:
         Extract sequence dataset for LSTM/Transformer models
         Format: [track_id, timestamp, x, y, z, vx, vy, vz, features...]
         """
-        sequences = []
+        # Detections of all eligible tracks are stacked into one table; each
+        # track contributes the stacked row indices covered by its windows
+        detections: List[NormalizedRadarData] = []
+        window_rows, track_ids, track_states = [], [], []
         
         for track in tracks:
-            if len(track.detections) < window_size:
+            n_dets = len(track.detections)
+            if n_dets < window_size:
                 continue
             
-            for i in range(0, len(track.detections) - window_size + 1, stride):
-                window = track.detections[i:i + window_size]
-                
-                for det in window:
-                    if det.position_enu and det.velocity_enu:
-                        sequences.append({
-                            'track_id': track.track_id,
-                            'sensor_id': det.sensor_id,
-                            'timestamp': det.timestamp,
-                            'x': det.position_enu[0],
-                            'y': det.position_enu[1],
-                            'z': det.position_enu[2],
-                            'vx': det.velocity_enu[0],
-                            'vy': det.velocity_enu[1],
-                            'vz': det.velocity_enu[2],
-                            'range_m': det.range_m,
-                            'azimuth_deg': det.azimuth_deg,
-                            'elevation_deg': det.elevation_deg or 0,
-                            'doppler_mps': det.doppler_mps,
-                            'snr_db': det.snr_db,
-                            'rcs_dbsm': det.rcs_dbsm or 0,
-                            'track_state': track.track_state.value
-                        })
-        
-        return pd.DataFrame(sequences)
+            # Detection indices covered by each window (a strided view, no copy)
+            first = len(detections)
+            windows = sliding_window_view(np.arange(first, first + n_dets), window_size)[::stride].ravel()
+            window_rows.append(windows)
+            track_ids.append(np.full(len(windows), track.track_id, dtype=np.int64))
+            track_states.append(np.full(len(windows), track.track_state.value, dtype=object))
+            detections.extend(track.detections)
+        
+        if not detections:
+            return pd.DataFrame()
+        
+        # Per-detection features staged once for all tracks; windows then
+        # gather from them, skipping detections without a full state
+        complete = np.array([bool(d.position_enu and d.velocity_enu) for d in detections])
+        staged = np.array(
+            [
+                [*d.position_enu[:3], *d.velocity_enu[:3], d.range_m, d.azimuth_deg,
+                 d.elevation_deg or 0, d.doppler_mps, d.snr_db, d.rcs_dbsm or 0]
+                if ok else _MISSING_SEQUENCE_ROW
+                for d, ok in zip(detections, complete)
+            ],
+            dtype=np.float64
+        )
+        
+        rows = np.concatenate(window_rows)
+        keep = complete[rows]
+        rows = rows[keep]
+        if not len(rows):
+            return pd.DataFrame()
+        
+        columns = {
+            'track_id': np.concatenate(track_ids)[keep],
+            'sensor_id': np.array([d.sensor_id for d in detections], dtype=object)[rows],
+            'timestamp': _timestamp_column([d.timestamp for d in detections])[rows],
+        }
+        columns.update(zip(_SEQUENCE_FEATURES, staged[rows].T))
+        columns['track_state'] = np.concatenate(track_states)[keep]
+        
+        # Columns are freshly built, pandas need not copy them
+        return pd.DataFrame(columns, copy=False)
     
     def extract_tabular_dataset(
         self,
@@ -64,75 +127,75 @@ class DataExtractor:
         Extract tabular dataset for classical ML models
         Format: One row per detection with all features
         """
-        rows = []
-        
-        for det in detections:
-            row = {
-                'timestamp': det.timestamp,
-                'sensor_id': det.sensor_id,
-                'target_id': det.target_id or -1,
-                'range_m': det.range_m,
-                'azimuth_deg': det.azimuth_deg,
-                'elevation_deg': det.elevation_deg or 0,
-                'doppler_mps': det.doppler_mps,
-                'snr_db': det.snr_db,
-                'rcs_dbsm': det.rcs_dbsm or 0,
-            }
-            
-            if det.position_enu:
-                row['x'] = det.position_enu[0]
-                row['y'] = det.position_enu[1]
-                row['z'] = det.position_enu[2]
-            
-            if det.velocity_enu:
-                row['vx'] = det.velocity_enu[0]
-                row['vy'] = det.velocity_enu[1]
-                row['vz'] = det.velocity_enu[2]
-            
-            rows.append(row)
+        if not detections:
+            return pd.DataFrame()
+        
+        # Build column arrays directly instead of one dict per row
+        columns = {
+            'timestamp': _timestamp_column([d.timestamp for d in detections]),
+            'sensor_id': [d.sensor_id for d in detections],
+            'target_id': np.array([d.target_id or -1 for d in detections], dtype=np.int64),
+        }
+        columns.update(_feature_columns(detections))
         
-        return pd.DataFrame(rows)
+        if any(d.position_enu for d in detections):
+            positions = np.array([d.position_enu or _MISSING_VECTOR for d in detections], dtype=np.float64)
+            columns.update(x=positions[:, 0], y=positions[:, 1], z=positions[:, 2])
+        
+        if any(d.velocity_enu for d in detections):
+            velocities = np.array([d.velocity_enu or _MISSING_VECTOR for d in detections], dtype=np.float64)
+            columns.update(vx=velocities[:, 0], vy=velocities[:, 1], vz=velocities[:, 2])
+        
+        # Columns are freshly built, pandas need not copy them
+        return pd.DataFrame(columns, copy=False)
     
     def extract_graph_dataset(
         self,
         tracks: List[TargetTrack],
-        time_window: float = 1.0
+        time_window: float = 1.0,
+        edge_threshold: float = 1000.0
     ) -> Dict[str, Any]:
         """
         Extract graph dataset for GNN models
         Format: Nodes (tracks) and edges (spatial relationships)
+        Tracks closer than edge_threshold meters are connected.
         """
         # Build adjacency matrix based on spatial proximity
         n_tracks = len(tracks)
         adjacency = np.zeros((n_tracks, n_tracks))
-        node_features = []
-        
-        for i, track_i in enumerate(tracks):
-            if track_i.state_vector:
-                pos_i = np.array(track_i.state_vector[:3])
-                
-                # Node features
-                node_features.append({
-                    'track_id': track_i.track_id,
-                    'x': track_i.state_vector[0],
-                    'y': track_i.state_vector[1],
-                    'z': track_i.state_vector[2],
-                    'vx': track_i.state_vector[3],
-                    'vy': track_i.state_vector[4],
-                    'vz': track_i.state_vector[5],
-                    'num_detections': len(track_i.detections),
-                    'track_state': track_i.track_state.value
-                })
-                
-                # Edges based on proximity
-                for j, track_j in enumerate(tracks):
-                    if i != j and track_j.state_vector:
-                        pos_j = np.array(track_j.state_vector[:3])
-                        distance = np.linalg.norm(pos_i - pos_j)
-                        
-                        # Connect if within 1km
-                        if distance < 1000:
-                            adjacency[i, j] = 1.0 / (distance + 1)  # Weight by inverse distance
+        valid = [i for i, track in enumerate(tracks) if track.state_vector]
+        
+        # Node features
+        node_features = [
+            {
+                'track_id': tracks[i].track_id,
+                'x': tracks[i].state_vector[0],
+                'y': tracks[i].state_vector[1],
+                'z': tracks[i].state_vector[2],
+                'vx': tracks[i].state_vector[3],
+                'vy': tracks[i].state_vector[4],
+                'vz': tracks[i].state_vector[5],
+                'num_detections': len(tracks[i].detections),
+                'track_state': tracks[i].track_state.value
+            }
+            for i in valid
+        ]
+        
+        if valid:
+            # Edges based on proximity; a k-d tree finds the close pairs without
+            # evaluating every pairwise distance
+            positions = np.array([tracks[i].state_vector[:3] for i in valid], dtype=np.float64)
+            pairs = cKDTree(positions).query_pairs(edge_threshold, output_type='ndarray')
+            first, second = pairs.T
+            distances = np.linalg.norm(positions[first] - positions[second], axis=1)
+            close = distances < edge_threshold
+            
+            # Weight by inverse distance, symmetric
+            node = np.array(valid)
+            first, second = node[first[close]], node[second[close]]
+            weights = 1.0 / (distances[close] + 1)
+            adjacency[first, second] = weights
+            adjacency[second, first] = weights
         
         return {
             'nodes': pd.DataFrame(node_features),
@@ -155,18 +218,23 @@ class DataExtractor:
         if len(positions) == 0:
             return {}
         
+        # Per-axis statistics in one reduction each, speeds computed once
+        pos_mean = positions.mean(axis=0)
+        pos_std = positions.std(axis=0)
+        speeds = np.linalg.norm(velocities, axis=1) if len(velocities) > 0 else None
+        
         features = {
             # Position statistics
-            'pos_mean_x': np.mean(positions[:, 0]),
-            'pos_mean_y': np.mean(positions[:, 1]),
-            'pos_mean_z': np.mean(positions[:, 2]),
-            'pos_std_x': np.std(positions[:, 0]),
-            'pos_std_y': np.std(positions[:, 1]),
-            'pos_std_z': np.std(positions[:, 2]),
+            'pos_mean_x': pos_mean[0],
+            'pos_mean_y': pos_mean[1],
+            'pos_mean_z': pos_mean[2],
+            'pos_std_x': pos_std[0],
+            'pos_std_y': pos_std[1],
+            'pos_std_z': pos_std[2],
             
             # Velocity statistics
-            'vel_mean': np.mean(np.linalg.norm(velocities, axis=1)) if len(velocities) > 0 else 0,
-            'vel_std': np.std(np.linalg.norm(velocities, axis=1)) if len(velocities) > 0 else 0,
+            'vel_mean': speeds.mean() if speeds is not None else 0,
+            'vel_std': speeds.std() if speeds is not None else 0,
             
             # Track characteristics
             'track_length': len(track.detections),
@@ -184,7 +252,10 @@ class DataExtractor:
         format: str = "tabular"
     ) -> MLDataset:
         """Create and register an ML dataset"""
-        sensor_ids = list(set(d.sensor_id for d in detections))
+        if isinstance(detections, NormalizedBatch):
+            sensor_ids = detections.unique_sensor_ids()
+        else:
+            sensor_ids = list(set(d.sensor_id for d in detections))
         timestamps = [d.timestamp for d in detections]
         
         dataset = MLDataset(
@@ -1,10 +1,107 @@
 """
 Data normalization engine - converts heterogeneous radar data to unified schema
 """
+import logging
+from math import cos, radians, sin
 import numpy as np
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from operator import itemgetter
+from typing import List, Optional, Sequence
 from ..models.schemas import RawRadarDetection, NormalizedRadarData, RadarType, TrackState
+from ._kernels import sph_to_enu
+
+
+logger = logging.getLogger(__name__)
+
+# Bound once; the normalizers read these for every detection
+_TENTATIVE = TrackState.TENTATIVE
+_CONFIRMED = TrackState.CONFIRMED
+
+# raw_data fields consumed by the spherical-to-ENU conversion
+_SPHERICAL_KEYS = ("range_m", "azimuth_deg", "elevation_deg", "doppler_mps")
+_spherical_values = itemgetter(*_SPHERICAL_KEYS)
+
+# ENU placeholder for detections without a vector (becomes NaN columns)
+_MISSING_VECTOR = (np.nan, np.nan, np.nan)
+
+
+def _optional_float(value) -> Optional[float]:
+    """float(value), passing None through (NormalizedRadarData does not coerce)"""
+    return None if value is None else float(value)
+
+
+class NormalizedBatch(Sequence[NormalizedRadarData]):
+    """
+    One frame of normalized detections with column (SoA) views
+    
+    Behaves as a read-only sequence of NormalizedRadarData records; numeric
+    columns are exposed as arrays so per-sensor selection and gating can be
+    done with numpy masks instead of Python loops. Columns not supplied at
+    construction are built on first access.
+    """
+    
+    def __init__(self, objs: List[NormalizedRadarData], enu: Optional[np.ndarray] = None):
+        self.objs = objs
+        if enu is not None:
+            self.__dict__["enu"] = enu
+    
+    def __len__(self) -> int:
+        return len(self.objs)
+    
+    def __getitem__(self, index):
+        return self.objs[index]
+    
+    def __iter__(self):
+        return iter(self.objs)
+    
+    @cached_property
+    def enu(self) -> np.ndarray:
+        """(N, 6) [x, y, z, vx, vy, vz] rows, NaN where a vector is missing"""
+        return np.array(
+            [[*(d.position_enu or _MISSING_VECTOR), *(d.velocity_enu or _MISSING_VECTOR)] for d in self.objs],
+            dtype=np.float64
+        ).reshape(-1, 6)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        return self.enu[:, :3]
+    
+    @property
+    def velocities(self) -> np.ndarray:
+        return self.enu[:, 3:]
+    
+    @cached_property
+    def sensor_ids(self) -> np.ndarray:
+        return np.array([d.sensor_id for d in self.objs], dtype=object)
+    
+    @cached_property
+    def range_m(self) -> np.ndarray:
+        return np.array([d.range_m for d in self.objs], dtype=np.float64)
+    
+    @cached_property
+    def azimuth_deg(self) -> np.ndarray:
+        return np.array([d.azimuth_deg for d in self.objs], dtype=np.float64)
+    
+    @cached_property
+    def elevation_deg(self) -> np.ndarray:
+        return np.array([d.elevation_deg or 0 for d in self.objs], dtype=np.float64)
+    
+    @cached_property
+    def doppler_mps(self) -> np.ndarray:
+        return np.array([d.doppler_mps for d in self.objs], dtype=np.float64)
+    
+    @cached_property
+    def snr_db(self) -> np.ndarray:
+        return np.array([d.snr_db for d in self.objs], dtype=np.float64)
+    
+    def sensor_mask(self, sensor_id: str) -> np.ndarray:
+        """Boolean mask selecting the detections of one sensor"""
+        return self.sensor_ids == sensor_id
+    
+    def unique_sensor_ids(self) -> List[str]:
+        """Sorted list of the sensors present in the batch"""
+        return np.unique(self.sensor_ids).tolist() if self.objs else []
 
 
 class DataNormalizer:
@@ -16,97 +113,89 @@ class DataNormalizer:
             RadarType.PULSE_DOPPLER: self._normalize_pulse_doppler,
             RadarType.AESA: self._normalize_aesa,
         }
+        # Dispatch keyed by the raw format string, avoids RadarType(...) per detection
+        self._by_format = {radar_type.value: fn for radar_type, fn in self.normalizers.items()}
     
     def normalize(self, raw_detection: RawRadarDetection) -> Optional[NormalizedRadarData]:
         """Normalize raw detection to unified format"""
+        # Unknown radar types fall back to generic normalization
+        normalizer = self._by_format.get(raw_detection.format_type, self._generic_normalize)
         try:
-            radar_type = RadarType(raw_detection.format_type)
-            normalizer = self.normalizers.get(radar_type)
-            
-            if normalizer:
-                return normalizer(raw_detection)
-            else:
-                return self._generic_normalize(raw_detection)
-                
-        except ValueError:
-            # Unknown radar type, use generic normalization
-            return self._generic_normalize(raw_detection)
+            return normalizer(raw_detection)
         except Exception as e:
-            print(f"Normalization error: {e}")
+            logger.warning("Normalization error: %s", e)
             return None
     
-    def _normalize_fmcw(self, raw: RawRadarDetection) -> NormalizedRadarData:
-        """Normalize FMCW radar data"""
-        data = raw.raw_data
-        
-        # Convert to ENU coordinates
-        range_m = data["range_m"]
-        azimuth_rad = np.radians(data["azimuth_deg"])
-        elevation_rad = np.radians(data["elevation_deg"])
+    @staticmethod
+    def _enu_from_spherical(range_m: float, azimuth_deg: float, elevation_deg: float, doppler_mps: float) -> tuple:
+        """Convert one spherical measurement to ENU position and radial velocity"""
+        azimuth_rad = radians(azimuth_deg)
+        elevation_rad = radians(elevation_deg)
         
-        # Spherical to Cartesian (ENU)
-        x = range_m * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        y = range_m * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        z = range_m * np.sin(elevation_rad)
+        # Line-of-sight unit vector (East-North-Up)
+        cos_el = cos(elevation_rad)
+        east = cos_el * sin(azimuth_rad)
+        north = cos_el * cos(azimuth_rad)
+        up = sin(elevation_rad)
         
         # Velocity vector (radial velocity only, approximate)
-        doppler = data["doppler_mps"]
-        vx = doppler * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        vy = doppler * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        vz = doppler * np.sin(elevation_rad)
+        return (
+            [range_m * east, range_m * north, range_m * up],
+            [doppler_mps * east, doppler_mps * north, doppler_mps * up]
+        )
+    
+    def _build_normalized(
+        self,
+        raw: RawRadarDetection,
+        enu: Optional[tuple],
+        track_state: Optional[TrackState],
+        metadata: dict
+    ) -> NormalizedRadarData:
+        """Assemble the unified record shared by all spherical radar types"""
+        data = raw.raw_data
+        # Converted here: NormalizedRadarData is a plain dataclass and stores
+        # raw values (e.g. numeric strings) as given
+        range_m, azimuth_deg, elevation_deg, doppler_mps = map(float, _spherical_values(data))
+        if enu is None:
+            enu = self._enu_from_spherical(range_m, azimuth_deg, elevation_deg, doppler_mps)
+        position_enu, velocity_enu = enu
         
         return NormalizedRadarData(
             timestamp=raw.timestamp,
             sensor_id=raw.sensor_id,
             target_id=data.get("target_id"),
-            range_m=data["range_m"],
-            azimuth_deg=data["azimuth_deg"],
-            elevation_deg=data["elevation_deg"],
-            doppler_mps=data["doppler_mps"],
-            snr_db=data["snr_db"],
-            rcs_dbsm=data.get("rcs_dbsm"),
-            track_state=TrackState.TENTATIVE if not data.get("is_false_alarm") else None,
-            position_enu=[float(x), float(y), float(z)],
-            velocity_enu=[float(vx), float(vy), float(vz)],
-            metadata={
+            range_m=range_m,
+            azimuth_deg=azimuth_deg,
+            elevation_deg=elevation_deg,
+            doppler_mps=doppler_mps,
+            snr_db=float(data["snr_db"]),
+            rcs_dbsm=_optional_float(data.get("rcs_dbsm")),
+            track_state=track_state,
+            position_enu=position_enu,
+            velocity_enu=velocity_enu,
+            metadata=metadata
+        )
+    
+    def _normalize_fmcw(self, raw: RawRadarDetection, enu: Optional[tuple] = None) -> NormalizedRadarData:
+        """Normalize FMCW radar data"""
+        data = raw.raw_data
+        return self._build_normalized(
+            raw, enu,
+            _TENTATIVE if not data.get("is_false_alarm") else None,
+            {
                 "beat_frequency_khz": data.get("beat_frequency_khz"),
                 "range_resolution_m": data.get("range_resolution_m"),
                 "radar_type": "FMCW"
             }
         )
     
-    def _normalize_pulse_doppler(self, raw: RawRadarDetection) -> NormalizedRadarData:
+    def _normalize_pulse_doppler(self, raw: RawRadarDetection, enu: Optional[tuple] = None) -> NormalizedRadarData:
         """Normalize Pulse-Doppler radar data"""
         data = raw.raw_data
-        
-        # Convert to ENU coordinates
-        range_m = data["range_m"]
-        azimuth_rad = np.radians(data["azimuth_deg"])
-        elevation_rad = np.radians(data["elevation_deg"])
-        
-        x = range_m * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        y = range_m * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        z = range_m * np.sin(elevation_rad)
-        
-        doppler = data["doppler_mps"]
-        vx = doppler * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        vy = doppler * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        vz = doppler * np.sin(elevation_rad)
-        
-        return NormalizedRadarData(
-            timestamp=raw.timestamp,
-            sensor_id=raw.sensor_id,
-            target_id=data.get("target_id"),
-            range_m=data["range_m"],
-            azimuth_deg=data["azimuth_deg"],
-            elevation_deg=data["elevation_deg"],
-            doppler_mps=data["doppler_mps"],
-            snr_db=data["snr_db"],
-            rcs_dbsm=data.get("rcs_dbsm"),
-            track_state=TrackState.TENTATIVE if not data.get("is_false_alarm") else None,
-            position_enu=[float(x), float(y), float(z)],
-            velocity_enu=[float(vx), float(vy), float(vz)],
-            metadata={
+        return self._build_normalized(
+            raw, enu,
+            _TENTATIVE if not data.get("is_false_alarm") else None,
+            {
                 "doppler_freq_hz": data.get("doppler_freq_hz"),
                 "prf_hz": data.get("prf_hz"),
                 "velocity_folded": data.get("velocity_folded"),
@@ -115,38 +204,13 @@ class DataNormalizer:
             }
         )
     
-    def _normalize_aesa(self, raw: RawRadarDetection) -> NormalizedRadarData:
+    def _normalize_aesa(self, raw: RawRadarDetection, enu: Optional[tuple] = None) -> NormalizedRadarData:
         """Normalize AESA radar data"""
         data = raw.raw_data
-        
-        # Convert to ENU coordinates
-        range_m = data["range_m"]
-        azimuth_rad = np.radians(data["azimuth_deg"])
-        elevation_rad = np.radians(data["elevation_deg"])
-        
-        x = range_m * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        y = range_m * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        z = range_m * np.sin(elevation_rad)
-        
-        doppler = data["doppler_mps"]
-        vx = doppler * np.cos(elevation_rad) * np.sin(azimuth_rad)
-        vy = doppler * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        vz = doppler * np.sin(elevation_rad)
-        
-        return NormalizedRadarData(
-            timestamp=raw.timestamp,
-            sensor_id=raw.sensor_id,
-            target_id=data.get("target_id"),
-            range_m=data["range_m"],
-            azimuth_deg=data["azimuth_deg"],
-            elevation_deg=data["elevation_deg"],
-            doppler_mps=data["doppler_mps"],
-            snr_db=data["snr_db"],
-            rcs_dbsm=data.get("rcs_dbsm"),
-            track_state=TrackState.CONFIRMED if data["snr_db"] > 15 else TrackState.TENTATIVE,
-            position_enu=[float(x), float(y), float(z)],
-            velocity_enu=[float(vx), float(vy), float(vz)],
-            metadata={
+        return self._build_normalized(
+            raw, enu,
+            _CONFIRMED if data["snr_db"] > 15 else _TENTATIVE,
+            {
                 "beam_azimuth_deg": data.get("beam_azimuth_deg"),
                 "beam_elevation_deg": data.get("beam_elevation_deg"),
                 "beam_gain_db": data.get("beam_gain_db"),
@@ -164,20 +228,78 @@ class DataNormalizer:
             timestamp=raw.timestamp,
             sensor_id=raw.sensor_id,
             target_id=data.get("target_id"),
-            range_m=data.get("range_m", 0),
-            azimuth_deg=data.get("azimuth_deg", 0),
-            elevation_deg=data.get("elevation_deg", 0),
-            doppler_mps=data.get("doppler_mps", 0),
-            snr_db=data.get("snr_db", 0),
-            rcs_dbsm=data.get("rcs_dbsm"),
+            range_m=float(data.get("range_m", 0)),
+            azimuth_deg=float(data.get("azimuth_deg", 0)),
+            elevation_deg=_optional_float(data.get("elevation_deg", 0)),
+            doppler_mps=float(data.get("doppler_mps", 0)),
+            snr_db=float(data.get("snr_db", 0)),
+            rcs_dbsm=_optional_float(data.get("rcs_dbsm")),
             metadata={"radar_type": "UNKNOWN"}
         )
     
-    def batch_normalize(self, raw_detections: List[RawRadarDetection]) -> List[NormalizedRadarData]:
-        """Normalize a batch of detections"""
-        normalized = []
-        for raw in raw_detections:
-            result = self.normalize(raw)
-            if result:
-                normalized.append(result)
-        return normalized
+    def batch_normalize(self, raw_detections: List[RawRadarDetection]) -> NormalizedBatch:
+        """
+        Normalize a batch of detections
+
+        The spherical-to-ENU conversion is evaluated once over the whole batch
+        instead of per detection; output order matches the input order.
+        """
+        results: List[Optional[NormalizedRadarData]] = [None] * len(raw_detections)
+        
+        # Detections handled by a type-specific normalizer share the same
+        # geometry; their spherical values are gathered in the same pass
+        batch_idx = []
+        batch_fn = []
+        spherical = []
+        by_format = self._by_format
+        for i, raw in enumerate(raw_detections):
+            normalizer = by_format.get(raw.format_type)
+            if normalizer is not None:
+                try:
+                    spherical.append(_spherical_values(raw.raw_data))
+                except KeyError:
+                    pass
+                else:
+                    batch_idx.append(i)
+                    batch_fn.append(normalizer)
+                    continue
+            results[i] = self.normalize(raw)
+        
+        if batch_idx:
+            try:
+                coords = np.array(spherical, dtype=np.float64)
+            except (TypeError, ValueError):
+                # Malformed values, fall back to per-detection handling
+                for i in batch_idx:
+                    results[i] = self.normalize(raw_detections[i])
+                batch_idx = []
+        
+        if batch_idx:
+            # Missing (None) or non-finite values become NaN in the array, and
+            # sph_to_enu only handles elevations within [-90, 90]; those rows
+            # go through normalize() so batch and single agree
+            valid = np.isfinite(coords).all(axis=1) & (np.abs(coords[:, 2]) <= 90.0)
+            if not valid.all():
+                for k in np.flatnonzero(~valid).tolist():
+                    results[batch_idx[k]] = self.normalize(raw_detections[batch_idx[k]])
+                keep_rows = np.flatnonzero(valid).tolist()
+                batch_idx = [batch_idx[k] for k in keep_rows]
+                batch_fn = [batch_fn[k] for k in keep_rows]
+                coords = coords[valid]
+        
+        if batch_idx:
+            enu_rows = sph_to_enu(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3])
+            for i, normalizer, row in zip(batch_idx, batch_fn, enu_rows.tolist()):
+                try:
+                    results[i] = normalizer(raw_detections[i], (row[:3], row[3:]))
+                except Exception as e:
+                    logger.warning("Normalization error: %s", e)
+        
+        keep = [i for i, result in enumerate(results) if result]
+        objs = [results[i] for i in keep]
+        
+        # Reuse the batch geometry as the ENU columns unless some rows went
+        # through the per-detection path, in which case they are built lazily
+        if batch_idx and len(batch_idx) == len(raw_detections):
+            return NormalizedBatch(objs, enu_rows[keep])
+        return NormalizedBatch(objs)
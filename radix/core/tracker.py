@@ -3,14 +3,46 @@ Multi-target tracking and data association
 """
 import numpy as np
 from datetime import datetime, timedelta
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial.distance import cdist
 from typing import List, Dict, Optional
 from ..models.schemas import NormalizedRadarData, TargetTrack, TrackState
+from .normalizer import NormalizedBatch
+
+
+# Half of an ENU state row for detections without a vector
+_NO_VECTOR = (np.nan, np.nan, np.nan)
+
+
+# Naive timestamps are UTC (datetime.utcnow()); converted against a fixed
+# epoch so the host's local timezone and DST never enter the arithmetic
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _posix_seconds(t: datetime) -> float:
+    """Seconds since the Unix epoch, naive datetimes taken as UTC"""
+    return (t - _EPOCH).total_seconds() if t.tzinfo is None else t.timestamp()
+
+
+def _detection_states(detections: List[NormalizedRadarData]) -> np.ndarray:
+    """(N, 6) ENU [x, y, z, vx, vy, vz] rows of the detections, NaN where missing"""
+    if isinstance(detections, NormalizedBatch):
+        return detections.enu
+    return np.array(
+        [
+            [*(d.position_enu[:3] if d.position_enu else _NO_VECTOR),
+             *(d.velocity_enu[:3] if d.velocity_enu else _NO_VECTOR)]
+            for d in detections
+        ],
+        dtype=np.float64
+    ).reshape(-1, 6)
 
 
 class SimpleTracker:
     """
     Simple nearest-neighbor tracker for demonstration
-    In production, use Kalman filters, JPDA, or MHT
+    Detections are assigned to tracks with a gated global nearest-neighbor
+    (Hungarian) assignment. In production, use Kalman filters, JPDA, or MHT
     """
     
     def __init__(self, max_association_distance: float = 100.0, max_coast_time: float = 5.0):
@@ -18,56 +50,98 @@ class SimpleTracker:
         self.next_track_id = 1
         self.max_association_distance = max_association_distance
         self.max_coast_time = max_coast_time
+        # State vectors and last update times (POSIX seconds) of the tracks,
+        # one row per slot; slots of removed tracks are reused
+        self._track_states = np.empty((0, 6), dtype=np.float64)
+        self._track_times = np.empty(0, dtype=np.float64)
+        self._slot_of: Dict[int, int] = {}  # track_id -> row, in self.tracks order
+        self._free_slots: List[int] = []
     
     def update(self, detections: List[NormalizedRadarData]) -> List[TargetTrack]:
         """Update tracks with new detections"""
         current_time = detections[0].timestamp if detections else datetime.utcnow()
+        now = _posix_seconds(current_time)
         
-        # Match detections to existing tracks
-        unassociated_detections = list(detections)
-        updated_tracks = set()
+        # Squared track-to-detection distances in one pass
+        tracks = list(self.tracks.values())
+        slots = np.fromiter(self._slot_of.values(), dtype=np.intp, count=len(self._slot_of))
+        det_states = _detection_states(detections)
+        dist2 = cdist(self._track_states[slots, :3], det_states[:, :3], 'sqeuclidean')
         
-        for track_id, track in list(self.tracks.items()):
-            best_detection = None
-            best_distance = self.max_association_distance
-            
-            for detection in unassociated_detections:
-                if detection.position_enu and track.state_vector:
-                    # Calculate distance
-                    det_pos = np.array(detection.position_enu[:3])
-                    track_pos = np.array(track.state_vector[:3])
-                    distance = np.linalg.norm(det_pos - track_pos)
-                    
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_detection = detection
-            
-            if best_detection:
-                # Update track
-                self._update_track(track, best_detection, current_time)
-                unassociated_detections.remove(best_detection)
-                updated_tracks.add(track_id)
-            else:
-                # Coast track
-                time_since_update = (current_time - track.last_updated).total_seconds()
-                if time_since_update < self.max_coast_time:
-                    track.track_state = TrackState.COASTING
-                else:
-                    track.track_state = TrackState.LOST
+        # Globally optimal assignment within the association gate. Only tracks
+        # and detections with at least one gated pair enter the solver. Pairs
+        # outside the gate (or without a position) cost more than any set of
+        # gated pairs, so the solver only uses them when nothing else is left;
+        # they are dropped from the result.
+        gate2 = self.max_association_distance ** 2
+        gated = dist2 < gate2
+        cand_rows = np.flatnonzero(gated.any(axis=1))
+        cand_cols = np.flatnonzero(gated.any(axis=0))
+        candidates = np.ix_(cand_rows, cand_cols)
+        sub_gated = gated[candidates]
+        sub_rows, sub_cols = linear_sum_assignment(
+            np.where(sub_gated, dist2[candidates], gate2 * (len(cand_rows) + 1))
+        )
+        valid = sub_gated[sub_rows, sub_cols]
+        rows, cols = cand_rows[sub_rows[valid]], cand_cols[sub_cols[valid]]
+        
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            self._update_track(tracks[row], detections[col], current_time)
+        
+        # Tracks without a detection coast until max_coast_time has passed,
+        # classified on the state arrays so only their objects are touched
+        unassigned = np.ones(len(tracks), dtype=bool)
+        unassigned[rows] = False
+        coasting = now - self._track_times[slots] < self.max_coast_time
+        for row in np.flatnonzero(unassigned & coasting).tolist():
+            tracks[row].track_state = TrackState.COASTING
+        lost = []
+        for row in np.flatnonzero(unassigned & ~coasting).tolist():
+            tracks[row].track_state = TrackState.LOST
+            lost.append(tracks[row].track_id)
+        
+        # Mirror the state vectors replaced by _update_track (detections with
+        # both position and velocity) in the state array
+        complete = ~np.isnan(det_states).any(axis=1)
+        replaced = complete[cols]
+        self._track_states[slots[rows[replaced]]] = det_states[cols[replaced]]
+        self._track_times[slots[rows]] = now
         
-        # Create new tracks for unassociated detections
-        for detection in unassociated_detections:
-            if detection.position_enu and detection.velocity_enu:
-                self._create_track(detection, current_time)
+        # Create new tracks for unclaimed detections (by index, detections are
+        # never compared or removed from a list)
+        claimed = np.zeros(len(detections), dtype=bool)
+        claimed[cols] = True
+        new_idx = np.flatnonzero(complete & ~claimed)
+        first_new_id = self.next_track_id
+        for i in new_idx.tolist():
+            self._create_track(detections[i], current_time)
+        if len(new_idx):
+            new_slots = self._allocate_slots(range(first_new_id, self.next_track_id))
+            self._track_states[new_slots] = det_states[new_idx]
+            self._track_times[new_slots] = now
         
-        # Remove lost tracks
-        self.tracks = {
-            tid: track for tid, track in self.tracks.items()
-            if track.track_state != TrackState.LOST
-        }
+        # Remove lost tracks, their slots go back to the free list
+        for track_id in lost:
+            del self.tracks[track_id]
+            self._free_slots.append(self._slot_of.pop(track_id))
         
         return list(self.tracks.values())
     
+    def _allocate_slots(self, track_ids) -> np.ndarray:
+        """Assign state-array rows to new tracks, growing the arrays by doubling"""
+        track_ids = list(track_ids)
+        shortfall = len(track_ids) - len(self._free_slots)
+        if shortfall > 0:
+            capacity = len(self._track_times)
+            new_capacity = max(2 * capacity, capacity + shortfall, 16)
+            self._track_states = np.resize(self._track_states, (new_capacity, 6))
+            self._track_times = np.resize(self._track_times, new_capacity)
+            self._free_slots.extend(range(new_capacity - 1, capacity - 1, -1))
+        
+        slots = [self._free_slots.pop() for _ in track_ids]
+        self._slot_of.update(zip(track_ids, slots))
+        return np.array(slots, dtype=np.intp)
+    
     def _create_track(self, detection: NormalizedRadarData, current_time: datetime):
         """Create new track from detection"""
         state_vector = detection.position_enu + detection.velocity_enu
@@ -99,10 +173,6 @@ class SimpleTracker:
             track.track_state = TrackState.CONFIRMED
         else:
             track.track_state = TrackState.TENTATIVE
-        
-        # Keep only recent detections
-        if len(track.detections) > 50:
-            track.detections = track.detections[-50:]
     
     def get_active_tracks(self) -> List[TargetTrack]:
         """Get all active (confirmed or coasting) tracks"""
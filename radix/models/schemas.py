@@ -1,9 +1,11 @@
 """
 Unified data schemas for RADIX
 """
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Deque
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
@@ -34,16 +36,29 @@ class RadarConfig(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class RawRadarDetection(BaseModel):
-    """Raw radar detection before normalization"""
+@dataclass(slots=True, kw_only=True)
+class RawRadarDetection:
+    """
+    Raw radar detection before normalization
+    
+    Internal hand-off from the simulators to the normalizer, kept as a plain
+    dataclass like NormalizedRadarData so no validation runs per detection.
+    """
     timestamp: datetime
     sensor_id: str
     raw_data: Dict[str, Any]
     format_type: str
 
 
-class NormalizedRadarData(BaseModel):
-    """Unified normalized radar data schema"""
+@dataclass(slots=True, kw_only=True)
+class NormalizedRadarData:
+    """
+    Unified normalized radar data schema
+    
+    A plain dataclass rather than a pydantic model: one is created for every
+    detection on the real-time path, so per-field validation is skipped.
+    Pydantic models embedding it (e.g. TargetTrack) still serialize it.
+    """
     timestamp: datetime
     sensor_id: str
     target_id: Optional[int] = None
@@ -57,24 +72,27 @@ class NormalizedRadarData(BaseModel):
     position_enu: Optional[List[float]] = None  # East-North-Up coordinates
     velocity_enu: Optional[List[float]] = None
     raw_iq_ref: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "timestamp": "2025-12-18T10:30:00Z",
-                "sensor_id": "RADAR_A",
-                "target_id": 128,
-                "range_m": 3450.0,
-                "azimuth_deg": 23.4,
-                "elevation_deg": 5.2,
-                "doppler_mps": -12.6,
-                "snr_db": 18.2,
-                "track_state": "CONFIRMED",
-                "position_enu": [2000, 3000, 100],
-                "velocity_enu": [-10, -5, 0]
-            }
+    __pydantic_config__ = ConfigDict(json_schema_extra={
+        "example": {
+            "timestamp": "2025-12-18T10:30:00Z",
+            "sensor_id": "RADAR_A",
+            "target_id": 128,
+            "range_m": 3450.0,
+            "azimuth_deg": 23.4,
+            "elevation_deg": 5.2,
+            "doppler_mps": -12.6,
+            "snr_db": 18.2,
+            "track_state": "CONFIRMED",
+            "position_enu": [2000, 3000, 100],
+            "velocity_enu": [-10, -5, 0]
         }
+    })
+
+
+# Detections kept per track, oldest evicted first
+MAX_TRACK_DETECTIONS = 50
 
 
 class TargetTrack(BaseModel):
@@ -86,9 +104,17 @@ class TargetTrack(BaseModel):
     state_vector: List[float]  # [x, y, z, vx, vy, vz]
     covariance: Optional[List[List[float]]] = None
     track_state: TrackState
-    detections: List[NormalizedRadarData] = Field(default_factory=list)
+    detections: Deque[NormalizedRadarData] = Field(
+        default_factory=lambda: deque(maxlen=MAX_TRACK_DETECTIONS)
+    )
     classification: Optional[str] = None
     confidence: Optional[float] = None
+    
+    @field_validator("detections")
+    @classmethod
+    def _bound_detections(cls, detections: Deque[NormalizedRadarData]) -> Deque[NormalizedRadarData]:
+        """Keep the history in a bounded deque so appends evict in O(1)"""
+        return deque(detections, maxlen=MAX_TRACK_DETECTIONS)
 
 
 class MLDataset(BaseModel):
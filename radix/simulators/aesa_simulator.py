@@ -2,9 +2,8 @@
 AESA (Active Electronically Scanned Array) Radar Simulator
 """
 import numpy as np
-from datetime import datetime
-from typing import Dict, Any, Optional
-from .base import RadarSimulator, Target
+from typing import Dict, Any, List, Optional
+from .base import MEASUREMENT_KEYS, RadarSimulator, Target, clamp
 
 
 class AESARadarSimulator(RadarSimulator):
@@ -13,6 +12,15 @@ class AESARadarSimulator(RadarSimulator):
     Used in advanced defense systems with electronic beam steering
     """
     
+    # Better angle accuracy than the mechanically scanned radars
+    noise_scale = (0.5, 0.3, 0.3, 0.5)
+    
+    # Beam pointing and gain are evaluated with the frame arrays
+    detection_keys = MEASUREMENT_KEYS + ("beam_azimuth_deg", "beam_gain_db")
+    
+    # Azimuth advance of the scan pattern per detection (degrees)
+    scan_step_deg = 5
+    
     def __init__(self, config):
         super().__init__(config)
         self.frequency_ghz = config.metadata.get("frequency_ghz", 35)
@@ -23,6 +31,9 @@ class AESARadarSimulator(RadarSimulator):
         self.wavelength_m = 3e8 / (self.frequency_ghz * 1e9)
         self.element_spacing = self.wavelength_m / 2
         
+        # Gaussian beam pattern coefficient, dB per squared degree off boresight
+        self._gain_db_per_deg2 = -12 / self.beam_width_deg ** 2
+        
         # Beam steering parameters
         self.scan_azimuth_range = (-60, 60)  # degrees
         self.scan_elevation_range = (-45, 45)  # degrees
@@ -31,63 +42,145 @@ class AESARadarSimulator(RadarSimulator):
         self.beam_azimuth = 0
         self.beam_elevation = 0
         
+        # Detection fields in output order, per-radar constants filled in;
+        # copied and completed for every detection
+        self._detection_template = {
+            "target_id": None,
+            "range_m": None,
+            "azimuth_deg": None,
+            "elevation_deg": None,
+            "doppler_mps": None,
+            "snr_db": None,
+            "rcs_dbsm": None,
+            "beam_azimuth_deg": None,
+            "beam_elevation_deg": None,
+            "beam_gain_db": None,
+            "num_elements": self.elements,
+            "phase_noise_deg": None,
+            "angle_accuracy_deg": self.angle_noise_std * self.noise_scale[1],
+            "is_false_alarm": False
+        }
+        
     def steer_beam(self, azimuth: float, elevation: float):
         """Electronically steer the beam"""
-        self.beam_azimuth = np.clip(azimuth, *self.scan_azimuth_range)
-        self.beam_elevation = np.clip(elevation, *self.scan_elevation_range)
+        # Limits unpacked up front, a star-args call costs as much as the clamp
+        az_low, az_high = self.scan_azimuth_range
+        el_low, el_high = self.scan_elevation_range
+        self.beam_azimuth = clamp(azimuth, az_low, az_high)
+        self.beam_elevation = clamp(elevation, el_low, el_high)
     
     def calculate_beam_gain(self, target_az: float, target_el: float) -> float:
         """Calculate antenna gain based on beam pointing and target angle"""
         # Angular difference from beam center
-        az_diff = abs(target_az - self.beam_azimuth)
-        el_diff = abs(target_el - self.beam_elevation)
+        az_diff = target_az - self.beam_azimuth
+        el_diff = target_el - self.beam_elevation
         
         # Gaussian beam pattern
-        gain_db = -12 * ((az_diff / self.beam_width_deg) ** 2 + 
-                         (el_diff / self.beam_width_deg) ** 2)
+        gain_db = self._gain_db_per_deg2 * (az_diff * az_diff + el_diff * el_diff)
         
-        return max(gain_db, -40)  # Minimum gain limit
+        return gain_db if gain_db > -40 else -40  # Minimum gain limit
     
-    def generate_detection(self, target: Target, timestamp: datetime) -> Optional[Dict[str, Any]]:
-        """Generate AESA-specific detection"""
-        range_m, azimuth_deg, elevation_deg = target.get_range_azimuth_elevation(self.radar_pos)
-        doppler_mps = target.get_doppler(self.radar_pos)
+    def calculate_beam_gain_batch(
+        self,
+        target_az: np.ndarray,
+        target_el: np.ndarray,
+        beam_azimuth: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized calculate_beam_gain with a per-target beam azimuth"""
+        az_diff = target_az - beam_azimuth
+        el_diff = target_el - self.beam_elevation
         
-        # Calculate beam gain
-        beam_gain_db = self.calculate_beam_gain(azimuth_deg, elevation_deg)
+        # Gaussian beam pattern with minimum gain limit, one pass over the arrays
+        gain_db = az_diff * az_diff
+        gain_db += el_diff * el_diff
+        gain_db *= self._gain_db_per_deg2
+        return np.maximum(gain_db, -40, out=gain_db)
+    
+    def scan_beam(self, n: int) -> np.ndarray:
+        """
+        Beam azimuths for the next n detections of the scan pattern
         
-        # Enhanced SNR calculation with beam gain
-        snr_db = self.calculate_snr(range_m, target.rcs) + beam_gain_db
+        The beam advances scan_step_deg per detection and restarts at the
+        low edge once it passes the high edge. Returns the pointing used by
+        each detection and leaves the beam where the next one would be.
+        """
+        low, high = self.scan_azimuth_range
+        step = self.scan_step_deg
+        k = np.arange(n + 1)
         
-        # AESA has better angle accuracy
-        range_m += np.random.normal(0, self.range_noise_std * 0.5)
-        azimuth_deg += np.random.normal(0, self.angle_noise_std * 0.3)
-        elevation_deg += np.random.normal(0, self.angle_noise_std * 0.3)
-        doppler_mps += np.random.normal(0, self.doppler_noise_std * 0.5)
+        # Detections before the first wrap continue from the current pointing,
+        # later ones cycle through low, low + step, ..., high
+        first_wrap = int((high - self.beam_azimuth) // step) + 1
+        cycle = int((high - low) // step) + 1
+        schedule = np.where(
+            k < first_wrap,
+            self.beam_azimuth + step * k,
+            low + step * ((k - first_wrap) % cycle)
+        )
+        
+        self.beam_azimuth = schedule[n].item()
+        return schedule[:n]
+    
+    def simulate_frame_arrays(self) -> Dict[str, np.ndarray]:
+        """Frame arrays with the beam gain of every detection applied to its SNR"""
+        measured = super().simulate_frame_arrays()
+        
+        beam_azimuth = self.scan_beam(len(measured["target_index"]))
+        beam_gain = self.calculate_beam_gain_batch(
+            measured["azimuth_deg"], measured["elevation_deg"], beam_azimuth
+        )
+        
+        measured["snr_db"] = measured["snr_db"] + beam_gain
+        measured["beam_azimuth_deg"] = beam_azimuth
+        measured["beam_gain_db"] = beam_gain
+        return measured
+    
+    def format_detections(self, measured: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Detection data for a whole frame, formatted column-wise"""
+        n = len(measured["target_index"])
+        return self.fill_detection_template({
+            **measured,
+            "beam_elevation_deg": np.full(n, self.beam_elevation),
+            "phase_noise_deg": self.rng.normal(0, 5, n)
+        })
+    
+    def format_detection(
+        self,
+        target: Target,
+        range_m: float,
+        azimuth_deg: float,
+        elevation_deg: float,
+        doppler_mps: float,
+        snr_db: float,
+        beam_azimuth_deg: Optional[float] = None,
+        beam_gain_db: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate AESA-specific detection
+        
+        Frames pass the beam pointing and gain (already included in snr_db);
+        without them the beam is evaluated and advanced here.
+        """
+        if beam_gain_db is None:
+            beam_azimuth_deg = self.beam_azimuth
+            beam_gain_db = self.calculate_beam_gain(azimuth_deg, elevation_deg)
+            snr_db += beam_gain_db
+            self.scan_beam(1)
         
         # AESA can measure additional parameters
-        phase_noise_deg = np.random.normal(0, 5)
-        
-        detection = {
-            "target_id": target.target_id,
-            "range_m": max(0, range_m),
-            "azimuth_deg": azimuth_deg % 360,
-            "elevation_deg": np.clip(elevation_deg, -90, 90),
-            "doppler_mps": doppler_mps,
-            "snr_db": snr_db,
-            "rcs_dbsm": target.rcs,
-            "beam_azimuth_deg": self.beam_azimuth,
-            "beam_elevation_deg": self.beam_elevation,
-            "beam_gain_db": beam_gain_db,
-            "num_elements": self.elements,
-            "phase_noise_deg": phase_noise_deg,
-            "angle_accuracy_deg": self.angle_noise_std * 0.3,
-            "is_false_alarm": False
-        }
+        phase_noise_deg = self.rng.normal(0, 5)
         
-        # Update beam steering (simple scan pattern)
-        self.beam_azimuth += 5
-        if self.beam_azimuth > self.scan_azimuth_range[1]:
-            self.beam_azimuth = self.scan_azimuth_range[0]
+        detection = self._detection_template.copy()
+        detection["target_id"] = target.target_id
+        detection["range_m"] = max(0, range_m)
+        detection["azimuth_deg"] = azimuth_deg % 360
+        detection["elevation_deg"] = clamp(elevation_deg, -90.0, 90.0)
+        detection["doppler_mps"] = doppler_mps
+        detection["snr_db"] = snr_db
+        detection["rcs_dbsm"] = target.rcs
+        detection["beam_azimuth_deg"] = beam_azimuth_deg
+        detection["beam_elevation_deg"] = self.beam_elevation
+        detection["beam_gain_db"] = beam_gain_db
+        detection["phase_noise_deg"] = phase_noise_deg
         
         return detection
@@ -1,23 +1,122 @@
 """
 Base classes for radar simulation
 """
+import math
 import numpy as np
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 from ..models.schemas import RadarConfig, RawRadarDetection, TrackState
 
 
+# Targets bounce off the walls of a +/- 10 km cube
+WORLD_BOUNDARY_M = 10000.0
+
+# Per-detection values produced by RadarSimulator.simulate_frame_arrays, in
+# format_detection argument order
+MEASUREMENT_KEYS = ("range_m", "azimuth_deg", "elevation_deg", "doppler_mps", "snr_db")
+
+# Uniform false-alarm measurement ranges, in MEASUREMENT_KEYS order
+FALSE_ALARM_LOW = (100.0, 0.0, -10.0, -50.0, 0.0)
+FALSE_ALARM_HIGH = (10000.0, 360.0, 45.0, 50.0, 8.0)
+
+# Upper edges of the low/medium SNR bands of should_detect (dB)
+SNR_BANDS_DB = np.array([0.0, 5.0, 13.0])
+
+
+def clamp(value: float, low: float, high: float) -> float:
+    """Clamp a scalar to [low, high] (np.clip costs a ufunc dispatch on scalars)"""
+    return low if value < low else (high if value > high else value)
+
+
+def propagate_targets(positions: np.ndarray, velocities: np.ndarray, dt: float):
+    """
+    Advance (N, 3) target position/velocity arrays in place by one step
+    
+    Vectorized equivalent of calling Target.update on every target.
+    """
+    positions += velocities * dt
+    
+    # Simple boundary checking - bounce off walls
+    outside = np.abs(positions) > WORLD_BOUNDARY_M
+    velocities[outside] *= -1
+    np.clip(positions, -WORLD_BOUNDARY_M, WORLD_BOUNDARY_M, out=positions)
+
+
+def target_geometry(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    radar_pos: np.ndarray,
+    rel: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> tuple:
+    """
+    Range, azimuth, elevation and Doppler of (N, 3) targets from one radar
+    
+    Vectorized equivalent of Target.get_range_azimuth_elevation and
+    Target.get_doppler; returns four length-N arrays. Optional (N, 3) ``rel``
+    and (4, N) ``out`` buffers are used instead of allocating temporaries,
+    the returned arrays are then rows of ``out``.
+    """
+    n = len(positions)
+    if out is None:
+        out = np.empty((4, n), dtype=np.float64)
+    range_m, azimuth_deg, elevation_deg, doppler_mps = out
+    
+    rel_pos = np.subtract(positions, radar_pos, out=rel)
+    np.einsum('ij,ij->i', rel_pos, rel_pos, out=range_m)
+    np.sqrt(range_m, out=range_m)
+    
+    # Azimuth (degrees from North, clockwise)
+    np.arctan2(rel_pos[:, 0], rel_pos[:, 1], out=azimuth_deg)
+    np.degrees(azimuth_deg, out=azimuth_deg)
+    azimuth_deg[azimuth_deg < 0] += 360
+    
+    # Elevation (degrees from horizontal)
+    np.add(range_m, 1e-9, out=elevation_deg)
+    np.divide(rel_pos[:, 2], elevation_deg, out=elevation_deg)
+    np.arcsin(elevation_deg, out=elevation_deg)
+    np.degrees(elevation_deg, out=elevation_deg)
+    
+    # Radial velocity, zero for a target on top of the radar
+    np.einsum('ij,ij->i', velocities, rel_pos, out=doppler_mps)
+    on_radar = range_m < 1e-9
+    np.divide(doppler_mps, range_m, out=doppler_mps, where=~on_radar)
+    doppler_mps[on_radar] = 0.0
+    
+    return range_m, azimuth_deg, elevation_deg, doppler_mps
+
+
 class Target:
-    """Simulated target with kinematic state"""
+    """
+    Simulated target with kinematic state
+    
+    Position and velocity are copied on construction; TargetSet.add then
+    re-points them at rows of the set (kept in target_set).
+    """
+    
+    __slots__ = (
+        "target_id", "position", "velocity", "_rcs", "track_state", "detection_count", "target_set"
+    )
     
     def __init__(self, target_id: int, position: np.ndarray, velocity: np.ndarray, rcs: float = 10.0):
         self.target_id = target_id
         self.position = np.array(position, dtype=np.float64)  # [x, y, z] in meters
         self.velocity = np.array(velocity, dtype=np.float64)  # [vx, vy, vz] in m/s
-        self.rcs = rcs  # Radar cross-section in dBsm
+        self._rcs = np.array([rcs], dtype=np.float64)  # Radar cross-section in dBsm
         self.track_state = TrackState.TENTATIVE
         self.detection_count = 0
+        self.target_set: Optional["TargetSet"] = None
+    
+    @property
+    def rcs(self) -> float:
+        """Radar cross-section in dBsm"""
+        return float(self._rcs[0])
+    
+    @rcs.setter
+    def rcs(self, value: float):
+        self._rcs[0] = value
     
     def update(self, dt: float):
         """Update target position"""
@@ -25,71 +124,203 @@ class Target:
         
         # Simple boundary checking - bounce off walls
         for i in range(3):
-            if abs(self.position[i]) > 10000:
+            if abs(self.position[i]) > WORLD_BOUNDARY_M:
                 self.velocity[i] *= -1
-                self.position[i] = np.clip(self.position[i], -10000, 10000)
+                self.position[i] = clamp(self.position[i], -WORLD_BOUNDARY_M, WORLD_BOUNDARY_M)
     
     def get_range_azimuth_elevation(self, radar_pos: np.ndarray) -> tuple:
         """Calculate range, azimuth, elevation from radar"""
-        rel_pos = self.position - radar_pos
-        range_m = np.linalg.norm(rel_pos)
+        # Scalar math: numpy dispatch costs more than the work on a 3-vector
+        x, y, z = self.position.tolist()
+        rx, ry, rz = radar_pos.tolist()
+        dx, dy, dz = x - rx, y - ry, z - rz
+        range_m = math.sqrt(dx * dx + dy * dy + dz * dz)
         
         # Azimuth (degrees from North, clockwise)
-        azimuth_deg = np.degrees(np.arctan2(rel_pos[0], rel_pos[1]))
+        azimuth_deg = math.degrees(math.atan2(dx, dy))
         if azimuth_deg < 0:
             azimuth_deg += 360
         
         # Elevation (degrees from horizontal)
-        elevation_deg = np.degrees(np.arcsin(rel_pos[2] / (range_m + 1e-9)))
+        elevation_deg = math.degrees(math.asin(dz / (range_m + 1e-9)))
         
         return range_m, azimuth_deg, elevation_deg
     
     def get_doppler(self, radar_pos: np.ndarray) -> float:
         """Calculate radial velocity (Doppler)"""
-        rel_pos = self.position - radar_pos
-        range_m = np.linalg.norm(rel_pos)
+        x, y, z = self.position.tolist()
+        rx, ry, rz = radar_pos.tolist()
+        dx, dy, dz = x - rx, y - ry, z - rz
+        range_m = math.sqrt(dx * dx + dy * dy + dz * dz)
         if range_m < 1e-9:
             return 0.0
         
         # Project velocity onto line-of-sight
-        los_unit = rel_pos / range_m
-        doppler_mps = np.dot(self.velocity, los_unit)
+        vx, vy, vz = self.velocity.tolist()
+        doppler_mps = (vx * dx + vy * dy + vz * dz) / range_m
         return doppler_mps
 
 
+class TargetSet:
+    """
+    Kinematic state of a group of targets in (N, 3) arrays (SoA)
+    
+    Member Target objects are views onto the rows (RCS included), so scalar
+    per-target code and the vectorized frame pipeline see the same state. A
+    target belongs to one set only; simulators observing the same targets
+    share the set (assign it to their targets attribute) rather than adding
+    the targets to sets of their own.
+    """
+    
+    def __init__(self, targets: Iterable[Target] = ()):
+        self._targets: List[Target] = []
+        self._positions = np.empty((0, 3), dtype=np.float64)
+        self._velocities = np.empty((0, 3), dtype=np.float64)
+        self._rcs = np.empty(0, dtype=np.float64)
+        for target in targets:
+            self.add(target)
+    
+    def __len__(self) -> int:
+        return len(self._targets)
+    
+    def __getitem__(self, index: int) -> Target:
+        return self._targets[index]
+    
+    def __iter__(self) -> Iterator[Target]:
+        return iter(self._targets)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) positions in meters"""
+        return self._positions[:len(self._targets)]
+    
+    @property
+    def velocities(self) -> np.ndarray:
+        """(N, 3) velocities in m/s"""
+        return self._velocities[:len(self._targets)]
+    
+    @property
+    def rcs(self) -> np.ndarray:
+        """(N,) radar cross-sections in dBsm"""
+        return self._rcs[:len(self._targets)]
+    
+    def add(self, target: Target):
+        """Move a target's state into the set, growing the arrays by doubling"""
+        if target.target_set is not None:
+            raise ValueError(
+                f"Target {target.target_id} already belongs to a TargetSet; "
+                "share that set instead of adding the target again"
+            )
+        
+        n = len(self._targets)
+        if n == len(self._rcs):
+            capacity = max(2 * n, 8)
+            for name in ("_positions", "_velocities", "_rcs"):
+                old = getattr(self, name)
+                grown = np.empty((capacity,) + old.shape[1:], dtype=np.float64)
+                grown[:n] = old
+                setattr(self, name, grown)
+            # Re-point existing members at the new buffers
+            for i, member in enumerate(self._targets):
+                member.position = self._positions[i]
+                member.velocity = self._velocities[i]
+                member._rcs = self._rcs[i:i + 1]
+        
+        self._positions[n] = target.position
+        self._velocities[n] = target.velocity
+        self._rcs[n] = target.rcs
+        target.position = self._positions[n]
+        target.velocity = self._velocities[n]
+        target._rcs = self._rcs[n:n + 1]
+        target.target_set = self
+        self._targets.append(target)
+    
+    def update(self, dt: float):
+        """Advance every target by one step (vectorized Target.update)"""
+        propagate_targets(self.positions, self.velocities, dt)
+
+
 class RadarSimulator(ABC):
     """Abstract base class for radar simulators"""
     
+    # Multipliers of the range/azimuth/elevation/Doppler noise std deviations
+    noise_scale = (1.0, 1.0, 1.0, 1.0)
+    
+    # Columns of simulate_frame_arrays passed to format_detection, in order
+    detection_keys = MEASUREMENT_KEYS
+    
     def __init__(self, config: RadarConfig):
         self.config = config
-        self.radar_pos = np.array(config.location)
-        self.targets: List[Target] = []
+        self._format_type = config.type.value
+        self.rng = np.random.default_rng()
+        self.radar_pos = np.array(config.location, dtype=np.float64)
+        self.targets = TargetSet()
         self.detection_probability = 0.95
         self.false_alarm_rate = 0.01
         self.range_noise_std = 5.0  # meters
         self.angle_noise_std = 0.5  # degrees
         self.doppler_noise_std = 0.5  # m/s
+        self._scratch_n = -1
+    
+    @property
+    def targets(self) -> TargetSet:
+        """Simulated targets (shared with other simulators by assigning the set)"""
+        return self._target_set
+    
+    @targets.setter
+    def targets(self, targets: Iterable[Target]):
+        # A plain list of targets (as accepted before TargetSet) is wrapped
+        self._target_set = targets if isinstance(targets, TargetSet) else TargetSet(targets)
+    
+    def _ensure_scratch(self, n: int):
+        """
+        (Re)allocate the per-frame target buffers when the target count changes
+        
+        The buffers are float32: millimetre resolution at the 10 km coverage
+        limit is far below the measurement noise, and halves the bytes moved
+        through the geometry pass.
+        """
+        if n != self._scratch_n:
+            self._pos = np.empty((n, 3), dtype=np.float32)
+            self._vel = np.empty((n, 3), dtype=np.float32)
+            self._rel = np.empty((n, 3), dtype=np.float32)
+            self._rcs = np.empty(n, dtype=np.float32)
+            self._geometry = np.empty((4, n), dtype=np.float32)
+            self._scratch_n = n
+    
+    def measurement_noise(self, n: int) -> np.ndarray:
+        """(n, 4) Gaussian range/azimuth/elevation/Doppler measurement errors"""
+        std = np.multiply(
+            (self.range_noise_std, self.angle_noise_std, self.angle_noise_std, self.doppler_noise_std),
+            self.noise_scale
+        )
+        return self.rng.normal(0.0, std, (n, 4))
     
     def add_target(self, target: Target):
         """Add target to simulation"""
-        self.targets.append(target)
+        self.targets.add(target)
     
     def update_targets(self, dt: float):
         """Update all target positions"""
-        for target in self.targets:
-            target.update(dt)
+        self.targets.update(dt)
     
     def calculate_snr(self, range_m: float, rcs: float) -> float:
         """Calculate SNR based on radar equation (simplified)"""
         # Simplified radar equation
         base_snr = 30.0  # dB at reference range
-        range_loss = 40 * np.log10(range_m / 1000.0)  # 1/R^4 loss
+        range_loss = 40 * (math.log10(range_m) - 3.0)  # 1/R^4 loss, 1 km reference
         rcs_gain = rcs
         
         snr_db = base_snr - range_loss + rcs_gain
-        snr_db += np.random.normal(0, 2.0)  # Add noise
+        snr_db += self.rng.normal(0, 2.0)  # Add noise
         
-        return max(snr_db, -10.0)
+        return snr_db if snr_db > -10.0 else -10.0
+    
+    def calculate_snr_batch(self, range_m: np.ndarray, rcs: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_snr over arrays of ranges and cross-sections"""
+        snr_db = 30.0 - 40 * (np.log10(range_m, dtype=np.float64) - 3.0) + rcs
+        snr_db += self.rng.normal(0, 2.0, len(snr_db))
+        return np.maximum(snr_db, -10.0)
     
     def should_detect(self, snr_db: float) -> bool:
         """Determine if target should be detected based on SNR"""
@@ -103,60 +334,190 @@ class RadarSimulator(ABC):
         else:
             prob = 0.1
         
-        return np.random.random() < prob
+        return self.rng.random() < prob
+    
+    def should_detect_batch(self, snr_db: np.ndarray) -> np.ndarray:
+        """Vectorized should_detect, returns a boolean mask"""
+        # Band index of each SNR (0: <= 0, 1: <= 5, 2: <= 13, 3: high) into a lookup table
+        band = np.searchsorted(SNR_BANDS_DB, snr_db)
+        prob = np.array((0.1, 0.3, 0.7, self.detection_probability))[band]
+        return self.rng.random(len(snr_db)) < prob
     
     @abstractmethod
-    def generate_detection(self, target: Target, timestamp: datetime) -> Optional[Dict[str, Any]]:
-        """Generate radar-specific detection data"""
+    def format_detection(
+        self,
+        target: Target,
+        range_m: float,
+        azimuth_deg: float,
+        elevation_deg: float,
+        doppler_mps: float,
+        snr_db: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate radar-specific detection data from measured (noisy) values
+        
+        Measurement noise scaled by noise_scale is already applied to range,
+        angles and Doppler; implementations add sensor-specific fields.
+        """
         pass
     
+    def generate_detection(self, target: Target, timestamp: datetime) -> Optional[Dict[str, Any]]:
+        """Generate radar-specific detection data for a single target"""
+        range_m, azimuth_deg, elevation_deg = target.get_range_azimuth_elevation(self.radar_pos)
+        doppler_mps = target.get_doppler(self.radar_pos)
+        snr_db = self.calculate_snr(range_m, target.rcs)
+        
+        noise = self.measurement_noise(1)[0].tolist()
+        return self.format_detection(
+            target,
+            range_m + noise[0],
+            azimuth_deg + noise[1],
+            elevation_deg + noise[2],
+            doppler_mps + noise[3],
+            snr_db
+        )
+    
+    def simulate_frame_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Simulate the target detections of one frame as column arrays
+        
+        Geometry, SNR and detection draws are evaluated for all targets at
+        once. Returns the index into self.targets of every detected target
+        with its measured (noisy) range, angles and Doppler and its SNR.
+        """
+        if not self.targets:
+            empty = np.empty(0)
+            return {"target_index": np.empty(0, dtype=np.intp), **{k: empty for k in MEASUREMENT_KEYS}}
+        
+        self._ensure_scratch(len(self.targets))
+        positions = self._pos
+        positions[:] = self.targets.positions
+        velocities = self._vel
+        velocities[:] = self.targets.velocities
+        rcs = self._rcs
+        rcs[:] = self.targets.rcs
+        
+        range_m, azimuth_deg, elevation_deg, doppler_mps = target_geometry(
+            positions, velocities, self.radar_pos, rel=self._rel, out=self._geometry
+        )
+        
+        # Check if in radar coverage
+        in_coverage = np.flatnonzero((range_m > 50) & (range_m < 10000))  # Min and max range
+        snr_db = self.calculate_snr_batch(range_m[in_coverage], rcs[in_coverage])
+        detected = self.should_detect_batch(snr_db)
+        idx = in_coverage[detected]
+        
+        # Measurement noise for all detected targets in one draw
+        noise = self.measurement_noise(len(idx))
+        return {
+            "target_index": idx,
+            "range_m": range_m[idx] + noise[:, 0],
+            "azimuth_deg": azimuth_deg[idx] + noise[:, 1],
+            "elevation_deg": elevation_deg[idx] + noise[:, 2],
+            "doppler_mps": doppler_mps[idx] + noise[:, 3],
+            "snr_db": snr_db[detected]
+        }
+    
+    def format_detections(self, measured: Dict[str, np.ndarray]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Detection data for every row of simulate_frame_arrays
+        
+        Calls format_detection row by row; simulators with a detection
+        template override this with fill_detection_template.
+        """
+        rows = np.column_stack([measured[k] for k in self.detection_keys]).tolist()
+        return [
+            self.format_detection(self.targets[i], *row)
+            for i, row in zip(measured["target_index"].tolist(), rows)
+        ]
+    
+    def fill_detection_template(self, measured: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        Copies of self._detection_template completed from frame columns
+        
+        Column-wise equivalent of format_detection: range, azimuth and
+        elevation are sanitized on the arrays, target_id and rcs_dbsm come
+        from the targets and every other column fills the field of the same
+        name. Integer columns stay integers.
+        """
+        target_index = measured["target_index"]
+        columns = {k: v for k, v in measured.items() if k != "target_index"}
+        columns["range_m"] = np.maximum(columns["range_m"], 0.0)
+        columns["azimuth_deg"] = columns["azimuth_deg"] % 360
+        columns["elevation_deg"] = np.clip(columns["elevation_deg"], -90.0, 90.0)
+        columns["rcs_dbsm"] = self.targets.rcs[target_index]
+        
+        keys = list(columns)
+        rows = zip(*[columns[k].tolist() for k in keys])
+        target_ids = [self.targets[i].target_id for i in target_index.tolist()]
+        
+        detections = []
+        for target_id, row in zip(target_ids, rows):
+            detection = self._detection_template.copy()
+            detection["target_id"] = target_id
+            detection.update(zip(keys, row))
+            detections.append(detection)
+        return detections
+    
     def simulate_frame(self, timestamp: datetime) -> List[RawRadarDetection]:
         """Simulate one radar frame"""
-        detections = []
-        
-        # Real target detections
-        for target in self.targets:
-            range_m, azimuth_deg, elevation_deg = target.get_range_azimuth_elevation(self.radar_pos)
-            
-            # Check if in radar coverage
-            if range_m > 50 and range_m < 10000:  # Min and max range
-                snr_db = self.calculate_snr(range_m, target.rcs)
-                
-                if self.should_detect(snr_db):
-                    detection_data = self.generate_detection(target, timestamp)
-                    if detection_data:
-                        detections.append(RawRadarDetection(
-                            timestamp=timestamp,
-                            sensor_id=self.config.id,
-                            raw_data=detection_data,
-                            format_type=self.config.type.value
-                        ))
+        # Frame-constant fields are bound once; only detected targets are formatted
+        sensor_id = self.config.id
+        format_type = self._format_type
+        detections = [
+            RawRadarDetection(
+                timestamp=timestamp,
+                sensor_id=sensor_id,
+                raw_data=detection_data,
+                format_type=format_type
+            )
+            for detection_data in self.format_detections(self.simulate_frame_arrays())
+            if detection_data
+        ]
         
         # False alarms
-        num_false_alarms = np.random.poisson(self.false_alarm_rate * 100)
-        for _ in range(num_false_alarms):
-            false_alarm = self.generate_false_alarm(timestamp)
-            if false_alarm:
-                detections.append(false_alarm)
+        num_false_alarms = self.rng.poisson(self.false_alarm_rate * 100)
+        if num_false_alarms:
+            detections.extend(self.generate_false_alarms(timestamp, num_false_alarms))
         
         return detections
     
+    def generate_false_alarms(self, timestamp: datetime, count: int) -> List[RawRadarDetection]:
+        """Generate false alarm detections, measurements drawn in one call"""
+        draws = self.rng.uniform(FALSE_ALARM_LOW, FALSE_ALARM_HIGH, (count, len(MEASUREMENT_KEYS)))
+        sensor_id = self.config.id
+        format_type = self._format_type
+        return [
+            RawRadarDetection(
+                timestamp=timestamp,
+                sensor_id=sensor_id,
+                raw_data={**dict(zip(MEASUREMENT_KEYS, row)), "is_false_alarm": True},
+                format_type=format_type
+            )
+            for row in draws.tolist()
+        ]
+    
     def generate_false_alarm(self, timestamp: datetime) -> Optional[RawRadarDetection]:
         """Generate false alarm detection"""
-        range_m = np.random.uniform(100, 10000)
-        azimuth_deg = np.random.uniform(0, 360)
-        elevation_deg = np.random.uniform(-10, 45)
-        
-        return RawRadarDetection(
-            timestamp=timestamp,
-            sensor_id=self.config.id,
-            raw_data={
-                "range_m": range_m,
-                "azimuth_deg": azimuth_deg,
-                "elevation_deg": elevation_deg,
-                "doppler_mps": np.random.uniform(-50, 50),
-                "snr_db": np.random.uniform(0, 8),
-                "is_false_alarm": True
-            },
-            format_type=self.config.type.value
-        )
+        return self.generate_false_alarms(timestamp, 1)[0]
+
+
+def simulate_all(
+    simulators: Iterable[RadarSimulator],
+    timestamp: datetime,
+    executor: Optional[Executor] = None
+) -> List[RawRadarDetection]:
+    """
+    Simulate one frame on every radar and concatenate the detections
+    
+    Simulators only read the shared target state and own their RNG and beam
+    state, so frames can be run concurrently on a thread executor. Only the
+    array stage (simulate_frame_arrays) releases the GIL, the per-detection
+    formatting does not, so threads help little unless the radars see many
+    targets; without an executor the radars run sequentially.
+    """
+    if executor is None:
+        frames = [simulator.simulate_frame(timestamp) for simulator in simulators]
+    else:
+        frames = list(executor.map(lambda simulator: simulator.simulate_frame(timestamp), simulators))
+    return [detection for frame in frames for detection in frame]
@@ -2,9 +2,8 @@
 FMCW (Frequency Modulated Continuous Wave) Radar Simulator
 """
 import numpy as np
-from datetime import datetime
-from typing import Dict, Any, Optional
-from .base import RadarSimulator, Target
+from typing import Dict, Any, List, Optional
+from .base import MEASUREMENT_KEYS, RadarSimulator, Target, clamp
 
 
 class FMCWRadarSimulator(RadarSimulator):
@@ -13,6 +12,9 @@ class FMCWRadarSimulator(RadarSimulator):
     Common in automotive and short-range applications
     """
     
+    # Beat frequency is evaluated with the frame arrays
+    detection_keys = MEASUREMENT_KEYS + ("beat_frequency_khz",)
+    
     def __init__(self, config):
         super().__init__(config)
         self.frequency_ghz = config.metadata.get("frequency_ghz", 77)
@@ -23,33 +25,58 @@ class FMCWRadarSimulator(RadarSimulator):
         self.range_resolution = 3e8 / (2 * self.bandwidth_mhz * 1e6)  # meters
         self.max_range = (3e8 * self.chirp_time_us * 1e-6) / 2
         
-    def generate_detection(self, target: Target, timestamp: datetime) -> Optional[Dict[str, Any]]:
-        """Generate FMCW-specific detection"""
-        range_m, azimuth_deg, elevation_deg = target.get_range_azimuth_elevation(self.radar_pos)
-        doppler_mps = target.get_doppler(self.radar_pos)
-        snr_db = self.calculate_snr(range_m, target.rcs)
-        
-        # Add FMCW-specific noise
-        range_m += np.random.normal(0, self.range_noise_std)
-        azimuth_deg += np.random.normal(0, self.angle_noise_std)
-        elevation_deg += np.random.normal(0, self.angle_noise_std)
-        doppler_mps += np.random.normal(0, self.doppler_noise_std)
+        # Beat frequency (kHz) per meter of range
+        self._beat_freq_per_m = (2 * self.bandwidth_mhz) / (3e8 * self.chirp_time_us * 1e-6) / 1000
         
-        # FMCW-specific measurements
-        beat_frequency_khz = (2 * self.bandwidth_mhz * range_m) / (3e8 * self.chirp_time_us * 1e-6) / 1000
-        
-        detection = {
-            "target_id": target.target_id,
-            "range_m": max(0, range_m),
-            "azimuth_deg": azimuth_deg % 360,
-            "elevation_deg": np.clip(elevation_deg, -90, 90),
-            "doppler_mps": doppler_mps,
-            "snr_db": snr_db,
-            "rcs_dbsm": target.rcs,
-            "beat_frequency_khz": beat_frequency_khz,
+        # Detection fields in output order, per-radar constants filled in;
+        # copied and completed for every detection
+        self._detection_template = {
+            "target_id": None,
+            "range_m": None,
+            "azimuth_deg": None,
+            "elevation_deg": None,
+            "doppler_mps": None,
+            "snr_db": None,
+            "rcs_dbsm": None,
+            "beat_frequency_khz": None,
             "chirp_time_us": self.chirp_time_us,
             "range_resolution_m": self.range_resolution,
             "is_false_alarm": False
         }
         
+    def simulate_frame_arrays(self) -> Dict[str, np.ndarray]:
+        """Frame arrays with the beat frequency of every detection"""
+        measured = super().simulate_frame_arrays()
+        measured["beat_frequency_khz"] = measured["range_m"] * self._beat_freq_per_m
+        return measured
+    
+    def format_detections(self, measured: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Detection data for a whole frame, formatted column-wise"""
+        return self.fill_detection_template(measured)
+    
+    def format_detection(
+        self,
+        target: Target,
+        range_m: float,
+        azimuth_deg: float,
+        elevation_deg: float,
+        doppler_mps: float,
+        snr_db: float,
+        beat_frequency_khz: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Generate FMCW-specific detection"""
+        # FMCW-specific measurements
+        if beat_frequency_khz is None:
+            beat_frequency_khz = self._beat_freq_per_m * range_m
+        
+        detection = self._detection_template.copy()
+        detection["target_id"] = target.target_id
+        detection["range_m"] = max(0, range_m)
+        detection["azimuth_deg"] = azimuth_deg % 360
+        detection["elevation_deg"] = clamp(elevation_deg, -90.0, 90.0)
+        detection["doppler_mps"] = doppler_mps
+        detection["snr_db"] = snr_db
+        detection["rcs_dbsm"] = target.rcs
+        detection["beat_frequency_khz"] = beat_frequency_khz
+        
         return detection
@@ -2,9 +2,8 @@
 Pulse-Doppler Radar Simulator
 """
 import numpy as np
-from datetime import datetime
-from typing import Dict, Any, Optional
-from .base import RadarSimulator, Target
+from typing import Dict, Any, List, Optional
+from .base import MEASUREMENT_KEYS, RadarSimulator, Target, clamp
 
 
 class PulseDopplerRadarSimulator(RadarSimulator):
@@ -13,6 +12,12 @@ class PulseDopplerRadarSimulator(RadarSimulator):
     Common in airborne and air defense applications
     """
     
+    # Elevation is measured less accurately
+    noise_scale = (1.0, 1.0, 1.5, 1.0)
+    
+    # Doppler frequency and ambiguities are evaluated with the frame arrays
+    detection_keys = MEASUREMENT_KEYS + ("doppler_freq_hz", "velocity_folded", "range_ambiguity")
+    
     def __init__(self, config):
         super().__init__(config)
         self.frequency_ghz = config.metadata.get("frequency_ghz", 10)
@@ -25,40 +30,79 @@ class PulseDopplerRadarSimulator(RadarSimulator):
         self.max_unambiguous_range = (3e8 / (2 * self.prf_hz))
         self.max_unambiguous_velocity = (self.wavelength_m * self.prf_hz) / 4
         
-    def generate_detection(self, target: Target, timestamp: datetime) -> Optional[Dict[str, Any]]:
-        """Generate Pulse-Doppler specific detection"""
-        range_m, azimuth_deg, elevation_deg = target.get_range_azimuth_elevation(self.radar_pos)
-        doppler_mps = target.get_doppler(self.radar_pos)
-        snr_db = self.calculate_snr(range_m, target.rcs)
-        
-        # Add noise
-        range_m += np.random.normal(0, self.range_noise_std)
-        azimuth_deg += np.random.normal(0, self.angle_noise_std)
-        elevation_deg += np.random.normal(0, self.angle_noise_std * 1.5)
-        doppler_mps += np.random.normal(0, self.doppler_noise_std)
-        
-        # Doppler frequency
-        doppler_freq_hz = 2 * doppler_mps / self.wavelength_m
-        
-        # Check for range/velocity ambiguities
-        range_ambiguity = int(range_m / self.max_unambiguous_range)
-        velocity_folded = doppler_mps % (2 * self.max_unambiguous_velocity) - self.max_unambiguous_velocity
+        # Per-detection conversion factors
+        self._inv_wavelength_x2 = 2.0 / self.wavelength_m
+        self._inv_max_range = 1.0 / self.max_unambiguous_range
+        self._two_max_vel = 2 * self.max_unambiguous_velocity
         
-        detection = {
-            "target_id": target.target_id,
-            "range_m": max(0, range_m),
-            "azimuth_deg": azimuth_deg % 360,
-            "elevation_deg": np.clip(elevation_deg, -90, 90),
-            "doppler_mps": doppler_mps,
-            "doppler_freq_hz": doppler_freq_hz,
-            "velocity_folded": velocity_folded,
-            "snr_db": snr_db,
-            "rcs_dbsm": target.rcs,
+        # Detection fields in output order, per-radar constants filled in;
+        # copied and completed for every detection
+        self._detection_template = {
+            "target_id": None,
+            "range_m": None,
+            "azimuth_deg": None,
+            "elevation_deg": None,
+            "doppler_mps": None,
+            "doppler_freq_hz": None,
+            "velocity_folded": None,
+            "snr_db": None,
+            "rcs_dbsm": None,
             "prf_hz": self.prf_hz,
             "pulse_width_us": self.pulse_width_us,
             "num_pulses": self.num_pulses,
-            "range_ambiguity": range_ambiguity,
+            "range_ambiguity": None,
             "is_false_alarm": False
         }
         
+    def simulate_frame_arrays(self) -> Dict[str, np.ndarray]:
+        """Frame arrays with the Doppler frequency and ambiguities of every detection"""
+        measured = super().simulate_frame_arrays()
+        doppler_mps = measured["doppler_mps"]
+        measured["doppler_freq_hz"] = doppler_mps * self._inv_wavelength_x2
+        measured["velocity_folded"] = doppler_mps % self._two_max_vel - self.max_unambiguous_velocity
+        measured["range_ambiguity"] = (measured["range_m"] * self._inv_max_range).astype(np.int64)
+        return measured
+    
+    def format_detections(self, measured: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Detection data for a whole frame, formatted column-wise"""
+        return self.fill_detection_template(measured)
+    
+    def format_detection(
+        self,
+        target: Target,
+        range_m: float,
+        azimuth_deg: float,
+        elevation_deg: float,
+        doppler_mps: float,
+        snr_db: float,
+        doppler_freq_hz: Optional[float] = None,
+        velocity_folded: Optional[float] = None,
+        range_ambiguity: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate Pulse-Doppler specific detection
+        
+        Frames pass the Doppler frequency and ambiguities; without them they
+        are computed here.
+        """
+        if doppler_freq_hz is None:
+            # Doppler frequency
+            doppler_freq_hz = doppler_mps * self._inv_wavelength_x2
+            
+            # Check for range/velocity ambiguities
+            range_ambiguity = range_m * self._inv_max_range
+            velocity_folded = doppler_mps % self._two_max_vel - self.max_unambiguous_velocity
+        
+        detection = self._detection_template.copy()
+        detection["target_id"] = target.target_id
+        detection["range_m"] = max(0, range_m)
+        detection["azimuth_deg"] = azimuth_deg % 360
+        detection["elevation_deg"] = clamp(elevation_deg, -90.0, 90.0)
+        detection["doppler_mps"] = doppler_mps
+        detection["doppler_freq_hz"] = doppler_freq_hz
+        detection["velocity_folded"] = velocity_folded
+        detection["snr_db"] = snr_db
+        detection["rcs_dbsm"] = target.rcs
+        detection["range_ambiguity"] = int(range_ambiguity)
+        
         return detection
@@ -44,7 +44,7 @@ echo ""
 
 # Start backend in background
 echo "Starting Backend on http://localhost:8000"
-python -m uvicorn radix.api.main:app --host 0.0.0.0 --port 8000 &
+python -m uvicorn radix.api.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --ws websockets &
 BACKEND_PID=$!
 
 # Wait for backend to start
@@ -2,9 +2,11 @@
 Tests for API endpoints
 """
 import pytest
+from datetime import datetime
 from fastapi.testclient import TestClient
 
-from radix.api.main import app
+from radix.api.main import app, state
+from radix.models.schemas import NormalizedRadarData
 
 
 client = TestClient(app)
@@ -29,6 +31,7 @@ class TestAPI:
         assert "total_detections" in data
         assert "active_tracks" in data
         assert "data_rate_hz" in data
+        assert data["timestamp"].endswith("+00:00")
     
     def test_radars_endpoint(self):
         response = client.get("/api/radars")
@@ -62,6 +65,52 @@ class TestAPI:
         assert isinstance(detections, list)
         assert len(detections) <= 10
     
+    def test_detections_cached_per_frame(self):
+        detection = NormalizedRadarData(
+            timestamp=datetime.utcnow(),
+            sensor_id="RADAR_TEST",
+            target_id=1,
+            range_m=1000.0,
+            azimuth_deg=45.0,
+            doppler_mps=-3.0,
+            snr_db=18.0
+        )
+        assert client.get("/api/detections").json() == []
+        
+        # Detections added within the same frame are served on the next one
+        state.all_detections.append(detection)
+        try:
+            assert client.get("/api/detections").json() == []
+            state.frame_count += 1
+            detections = client.get("/api/detections").json()
+            assert [d["sensor_id"] for d in detections] == ["RADAR_TEST"]
+        finally:
+            state.all_detections.clear()
+            state.frame_count -= 1
+    
+    def test_detections_limit_cache_is_bounded(self):
+        state.all_detections.extend(
+            NormalizedRadarData(
+                timestamp=datetime.utcnow(),
+                sensor_id="RADAR_TEST",
+                target_id=i,
+                range_m=1000.0,
+                azimuth_deg=45.0,
+                doppler_mps=-3.0,
+                snr_db=18.0
+            )
+            for i in range(300)
+        )
+        state.response_cache_frame = -1
+        try:
+            for limit in range(0, 300, 7):
+                detections = client.get(f"/api/detections?limit={limit}").json()
+                assert [d["target_id"] for d in detections] == list(range(300 - limit, 300))
+            assert len(state.response_cache) <= 2 * 4
+        finally:
+            state.all_detections.clear()
+            state.response_cache_frame = -1
+    
     def test_datasets_endpoint(self):
         response = client.get("/api/datasets")
         assert response.status_code == 200
@@ -81,7 +130,31 @@ class TestAPI:
         dataset = response.json()
         assert dataset["name"] == "Test Dataset"
         assert "dataset_id" in dataset
+        assert dataset["created_at"].endswith("+00:00")
     
     def test_export_dataset_invalid(self):
         response = client.get("/api/datasets/invalid_id/export")
         assert response.status_code == 404
+    
+    def test_websocket_receives_published_frames(self):
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_text("ping")
+            assert len(state.clients) == 1
+            
+            channel = next(iter(state.clients.values()))
+            websocket.portal.call(channel.publish, '{"type": "update"}')
+            assert websocket.receive_json() == {"type": "update"}
+    
+    def test_websocket_coalesces_queued_frames(self):
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_text("ping")
+            channel = next(iter(state.clients.values()))
+            
+            def publish_two():
+                channel.publish('{"type": "update", "seq": 1}')
+                channel.publish('{"type": "update", "seq": 2}')
+            
+            websocket.portal.call(publish_two)
+            message = websocket.receive_json()
+            assert message["type"] == "batch"
+            assert [frame["seq"] for frame in message["frames"]] == [1, 2]
@@ -9,6 +9,12 @@ from radix.models.schemas import NormalizedRadarData, TargetTrack, TrackState
 from radix.core.extractor import DataExtractor
 
 
+@pytest.fixture(scope="module")
+def extractor():
+    """Shared DataExtractor; the extract_* methods leave it unchanged"""
+    return DataExtractor()
+
+
 class TestDataExtractor:
     """Test DataExtractor"""
     
@@ -17,9 +23,7 @@ class TestDataExtractor:
         assert extractor is not None
         assert len(extractor.datasets) == 0
     
-    def test_tabular_extraction(self):
-        extractor = DataExtractor()
-        
+    def test_tabular_extraction(self, extractor):
         detections = [
             NormalizedRadarData(
                 timestamp=datetime.utcnow(),
@@ -43,9 +47,7 @@ class TestDataExtractor:
         assert 'azimuth_deg' in df.columns
         assert 'snr_db' in df.columns
     
-    def test_sequence_extraction(self):
-        extractor = DataExtractor()
-        
+    def test_sequence_extraction(self, extractor):
         # Create track with detections
         detections = [
             NormalizedRadarData(
@@ -80,9 +82,7 @@ class TestDataExtractor:
         assert 'x' in df.columns
         assert 'vx' in df.columns
     
-    def test_graph_extraction(self):
-        extractor = DataExtractor()
-        
+    def test_graph_extraction(self, extractor):
         # Create multiple tracks
         tracks = [
             TargetTrack(
@@ -105,9 +105,7 @@ class TestDataExtractor:
         assert isinstance(graph_data['nodes'], pd.DataFrame)
         assert len(graph_data['nodes']) == 5
     
-    def test_time_series_features(self):
-        extractor = DataExtractor()
-        
+    def test_time_series_features(self, extractor):
         detections = [
             NormalizedRadarData(
                 timestamp=datetime.utcnow(),
@@ -8,6 +8,12 @@ from radix.models.schemas import RawRadarDetection, RadarType
 from radix.core.normalizer import DataNormalizer
 
 
+@pytest.fixture(scope="module")
+def normalizer():
+    """Shared DataNormalizer; normalization keeps no state between calls"""
+    return DataNormalizer()
+
+
 class TestDataNormalizer:
     """Test DataNormalizer"""
     
@@ -16,9 +22,7 @@ class TestDataNormalizer:
         assert normalizer is not None
         assert len(normalizer.normalizers) > 0
     
-    def test_fmcw_normalization(self):
-        normalizer = DataNormalizer()
-        
+    def test_fmcw_normalization(self, normalizer):
         raw = RawRadarDetection(
             timestamp=datetime.utcnow(),
             sensor_id="RADAR_A",
@@ -50,9 +54,7 @@ class TestDataNormalizer:
         assert normalized.velocity_enu is not None
         assert len(normalized.velocity_enu) == 3
     
-    def test_pulse_doppler_normalization(self):
-        normalizer = DataNormalizer()
-        
+    def test_pulse_doppler_normalization(self, normalizer):
         raw = RawRadarDetection(
             timestamp=datetime.utcnow(),
             sensor_id="RADAR_B",
@@ -79,9 +81,7 @@ class TestDataNormalizer:
         assert normalized.metadata.get("doppler_freq_hz") == 1000.0
         assert normalized.metadata.get("prf_hz") == 10000
     
-    def test_aesa_normalization(self):
-        normalizer = DataNormalizer()
-        
+    def test_aesa_normalization(self, normalizer):
         raw = RawRadarDetection(
             timestamp=datetime.utcnow(),
             sensor_id="RADAR_C",
@@ -110,9 +110,7 @@ class TestDataNormalizer:
         assert normalized.metadata.get("beam_azimuth_deg") == 265.0
         assert normalized.metadata.get("num_elements") == 1024
     
-    def test_batch_normalization(self):
-        normalizer = DataNormalizer()
-        
+    def test_batch_normalization(self, normalizer):
         raw_detections = [
             RawRadarDetection(
                 timestamp=datetime.utcnow(),
@@ -138,9 +136,7 @@ class TestDataNormalizer:
             assert det.target_id == i
             assert det.range_m == 1000.0 + i * 100
     
-    def test_invalid_detection(self):
-        normalizer = DataNormalizer()
-        
+    def test_invalid_detection(self, normalizer):
         # Missing required fields
         raw = RawRadarDetection(
             timestamp=datetime.utcnow(),
@@ -153,3 +149,130 @@ class TestDataNormalizer:
         normalized = normalizer.normalize(raw)
         assert normalized is not None
         assert normalized.sensor_id == "RADAR_X"
+    
+    def test_numeric_fields_are_converted(self, normalizer):
+        for format_type in ("FMCW", "ISAR"):
+            raw = RawRadarDetection(
+                timestamp=datetime.utcnow(),
+                sensor_id="RADAR_X",
+                raw_data={
+                    "range_m": "12",
+                    "azimuth_deg": "45",
+                    "elevation_deg": 5,
+                    "doppler_mps": "-3.5",
+                    "snr_db": "18",
+                    "rcs_dbsm": "10"
+                },
+                format_type=format_type
+            )
+            
+            normalized = normalizer.normalize(raw)
+            assert normalized.range_m == 12.0
+            assert isinstance(normalized.range_m, float)
+            assert (normalized.azimuth_deg, normalized.doppler_mps) == (45.0, -3.5)
+            assert (normalized.snr_db, normalized.rcs_dbsm) == (18.0, 10.0)
+    
+    def test_batch_normalization_empty(self, normalizer):
+        batch = normalizer.batch_normalize([])
+        
+        assert len(batch) == 0
+        assert batch.enu.shape == (0, 6)
+    
+    def test_batch_matches_single_normalization(self, normalizer):
+        raw_detections = [
+            RawRadarDetection(
+                timestamp=datetime.utcnow(),
+                sensor_id="RADAR_A",
+                raw_data={
+                    "target_id": i,
+                    "range_m": 500.0 + i * 250,
+                    "azimuth_deg": 30.0 * i,
+                    "elevation_deg": 2.0 * i,
+                    "doppler_mps": 5.0 - i,
+                    "snr_db": 12.0 + i,
+                    "is_false_alarm": False
+                },
+                format_type=format_type
+            )
+            for i, format_type in enumerate(["FMCW", "PULSE_DOPPLER", "AESA", "UNKNOWN"])
+        ]
+        
+        # Elevation beyond the zenith
+        raw_detections.append(RawRadarDetection(
+            timestamp=datetime.utcnow(),
+            sensor_id="RADAR_A",
+            raw_data={
+                "target_id": 4,
+                "range_m": 50.0,
+                "azimuth_deg": 10.0,
+                "elevation_deg": 120.0,
+                "doppler_mps": 1.0,
+                "snr_db": 12.0,
+                "is_false_alarm": False
+            },
+            format_type="FMCW"
+        ))
+        
+        batch = normalizer.batch_normalize(raw_detections)
+        single = [normalizer.normalize(raw) for raw in raw_detections]
+        
+        assert len(batch) == len(single) == 5
+        for b, s in zip(batch, single):
+            assert b.target_id == s.target_id
+            assert b.track_state == s.track_state
+            assert b.metadata == s.metadata
+            if s.position_enu is None:
+                assert b.position_enu is None
+            else:
+                assert b.position_enu == pytest.approx(s.position_enu)
+                assert b.velocity_enu == pytest.approx(s.velocity_enu)
+    
+    def test_batch_drops_missing_coordinates(self, normalizer):
+        raw_detections = [
+            RawRadarDetection(
+                timestamp=datetime.utcnow(),
+                sensor_id="RADAR_A",
+                raw_data={
+                    "target_id": i,
+                    "range_m": 1000.0,
+                    "azimuth_deg": 45.0,
+                    "elevation_deg": elevation_deg,
+                    "doppler_mps": -5.0,
+                    "snr_db": 15.0,
+                    "is_false_alarm": False
+                },
+                format_type="FMCW"
+            )
+            for i, elevation_deg in enumerate([5.0, None, 10.0])
+        ]
+        
+        batch = normalizer.batch_normalize(raw_detections)
+        
+        assert normalizer.normalize(raw_detections[1]) is None
+        assert [d.target_id for d in batch] == [0, 2]
+    
+    def test_batch_sensor_columns(self, normalizer):
+        raw_detections = [
+            RawRadarDetection(
+                timestamp=datetime.utcnow(),
+                sensor_id=sensor_id,
+                raw_data={
+                    "target_id": i,
+                    "range_m": 1000.0 + i,
+                    "azimuth_deg": 10.0 * i,
+                    "elevation_deg": 1.0,
+                    "doppler_mps": -2.0,
+                    "snr_db": 15.0
+                },
+                format_type="FMCW"
+            )
+            for i, sensor_id in enumerate(["RADAR_B", "RADAR_A", "RADAR_B"])
+        ]
+        
+        batch = normalizer.batch_normalize(raw_detections)
+        
+        assert batch.unique_sensor_ids() == ["RADAR_A", "RADAR_B"]
+        assert batch.sensor_mask("RADAR_B").tolist() == [True, False, True]
+        assert batch.positions.shape == (3, 3)
+        for row, det in zip(batch.positions, batch):
+            assert row == pytest.approx(det.position_enu)
@@ -3,10 +3,11 @@ Tests for radar simulators
 """
 import pytest
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from radix.models.schemas import RadarConfig, RadarType
-from radix.simulators.base import Target
+from radix.simulators.base import Target, TargetSet, propagate_targets, simulate_all, target_geometry
 from radix.simulators.fmcw_simulator import FMCWRadarSimulator
 from radix.simulators.pulse_doppler_simulator import PulseDopplerRadarSimulator
 from radix.simulators.aesa_simulator import AESARadarSimulator
@@ -36,6 +37,17 @@ class TestTarget:
         expected_position = position + velocity * dt
         assert np.allclose(target.position, expected_position)
     
+    def test_target_copies_inputs(self):
+        position = np.zeros(3)
+        velocity = np.array([1.0, 0.0, 0.0])
+        a = Target(1, position, velocity)
+        b = Target(2, position, velocity)
+        
+        a.update(1.0)
+        
+        assert np.array_equal(position, [0.0, 0.0, 0.0])
+        assert np.array_equal(b.position, [0.0, 0.0, 0.0])
+    
     def test_range_azimuth_elevation(self):
         position = np.array([1000, 1000, 100])
         velocity = np.array([0, 0, 0])
@@ -60,6 +72,77 @@ class TestTarget:
         
         # Should be negative (approaching)
         assert doppler < 0
+    
+    def test_propagate_targets_matches_update(self):
+        positions = np.array([[1000.0, 2000.0, 100.0], [9995.0, -9990.0, 50.0]])
+        velocities = np.array([[10.0, -5.0, 0.0], [20.0, -30.0, 1.0]])
+        targets = [Target(i, positions[i].copy(), velocities[i].copy()) for i in range(2)]
+        
+        for _ in range(3):
+            propagate_targets(positions, velocities, 0.5)
+            for target in targets:
+                target.update(0.5)
+        
+        assert np.allclose(positions, [t.position for t in targets])
+        assert np.allclose(velocities, [t.velocity for t in targets])
+        assert np.all(np.abs(positions) <= 10000)
+    
+    def test_target_set_rows_are_views(self):
+        targets = [
+            Target(i, np.array([100.0 * i, 9990.0, 50.0]), np.array([1.0, 20.0, 0.0]), rcs=float(i))
+            for i in range(20)
+        ]
+        target_set = TargetSet(targets)
+        
+        target_set.update(1.0)
+        targets[3].update(1.0)
+        
+        assert len(target_set) == 20
+        assert np.array_equal(target_set.positions, [t.position for t in targets])
+        assert np.array_equal(target_set.velocities, [t.velocity for t in targets])
+        assert np.array_equal(target_set.rcs, np.arange(20.0))
+        assert target_set[3].position[1] == 9980.0
+    
+    def test_target_belongs_to_one_set(self):
+        target = Target(1, np.array([1000.0, 2000.0, 100.0]), np.array([10.0, -5.0, 0.0]))
+        target_set = TargetSet([target])
+        
+        with pytest.raises(ValueError):
+            TargetSet([target])
+        with pytest.raises(ValueError):
+            target_set.add(target)
+        assert len(target_set) == 1
+    
+    def test_target_rcs_is_shared_with_set(self):
+        targets = [Target(i, np.zeros(3), np.zeros(3), rcs=float(i)) for i in range(10)]
+        target_set = TargetSet(targets)
+        
+        targets[2].rcs = 25.0
+        target_set.rcs[4] = -5.0
+        
+        assert target_set.rcs[2] == 25.0
+        assert targets[4].rcs == -5.0
+    
+    def test_target_geometry_matches_scalar(self):
+        radar_pos = np.array([0.0, 0.0, 10.0])
+        targets = [
+            Target(1, np.array([1000.0, 2000.0, 100.0]), np.array([10.0, -5.0, 0.0])),
+            Target(2, np.array([-3000.0, -500.0, 800.0]), np.array([-20.0, 15.0, 2.0])),
+            Target(3, np.array([0.0, 0.0, 10.0]), np.array([5.0, 5.0, 0.0]))
+        ]
+        
+        range_m, azimuth_deg, elevation_deg, doppler_mps = target_geometry(
+            np.array([t.position for t in targets]),
+            np.array([t.velocity for t in targets]),
+            radar_pos
+        )
+        
+        for i, target in enumerate(targets):
+            assert np.allclose(
+                [range_m[i], azimuth_deg[i], elevation_deg[i]],
+                target.get_range_azimuth_elevation(radar_pos)
+            )
+            assert doppler_mps[i] == pytest.approx(target.get_doppler(radar_pos))
 
 
 class TestFMCWSimulator:
@@ -107,6 +190,97 @@ class TestFMCWSimulator:
             assert "range_m" in det.raw_data
             assert "azimuth_deg" in det.raw_data
             assert "doppler_mps" in det.raw_data
+    
+    def test_detection_probability_bands(self):
+        config = RadarConfig(
+            id="TEST_FMCW",
+            type=RadarType.FMCW,
+            location=[0, 0, 10],
+            frequency_ghz=77,
+            metadata={"frequency_ghz": 77, "bandwidth_mhz": 4000}
+        )
+        
+        sim = FMCWRadarSimulator(config)
+        sim.detection_probability = 1.0
+        
+        snr_db = np.array([20.0, 13.0, 5.0, 0.0, -5.0])
+        detected = np.mean([sim.should_detect_batch(snr_db) for _ in range(2000)], axis=0)
+        
+        assert detected[0] == 1.0
+        assert np.allclose(detected[1:], [0.7, 0.3, 0.1, 0.1], atol=0.05)
+    
+    def test_simulate_all(self):
+        simulators = []
+        for i in range(3):
+            config = RadarConfig(
+                id=f"TEST_FMCW_{i}",
+                type=RadarType.FMCW,
+                location=[0, 0, 10],
+                frequency_ghz=77,
+                metadata={"frequency_ghz": 77, "bandwidth_mhz": 4000}
+            )
+            sim = FMCWRadarSimulator(config)
+            sim.false_alarm_rate = 0.0
+            sim.detection_probability = 1.0
+            sim.add_target(Target(1, np.array([1000, 2000, 100]), np.array([10, -5, 0]), rcs=20.0))
+            simulators.append(sim)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            detections = simulate_all(simulators, datetime.utcnow(), executor)
+        
+        assert [d.sensor_id for d in detections] == ["TEST_FMCW_0", "TEST_FMCW_1", "TEST_FMCW_2"]
+    
+    def test_generate_false_alarms(self):
+        config = RadarConfig(
+            id="TEST_FMCW",
+            type=RadarType.FMCW,
+            location=[0, 0, 10],
+            frequency_ghz=77,
+            metadata={"frequency_ghz": 77, "bandwidth_mhz": 4000}
+        )
+        sim = FMCWRadarSimulator(config)
+        
+        alarms = sim.generate_false_alarms(datetime.utcnow(), 20)
+        
+        assert len(alarms) == 20
+        for alarm in alarms:
+            assert alarm.sensor_id == "TEST_FMCW"
+            assert alarm.raw_data["is_false_alarm"] is True
+            assert 100 <= alarm.raw_data["range_m"] <= 10000
+            assert -10 <= alarm.raw_data["elevation_deg"] <= 45
+    
+    def test_targets_accepts_list(self):
+        config = RadarConfig(
+            id="TEST_FMCW",
+            type=RadarType.FMCW,
+            location=[0, 0, 10],
+            frequency_ghz=77,
+            metadata={"frequency_ghz": 77, "bandwidth_mhz": 4000}
+        )
+        sim = FMCWRadarSimulator(config)
+        sim.false_alarm_rate = 0.0
+        sim.detection_probability = 1.0
+        
+        sim.targets = [Target(1, np.array([1000.0, 2000.0, 100.0]), np.array([10.0, -5.0, 0.0]), rcs=20.0)]
+        
+        assert isinstance(sim.targets, TargetSet)
+        assert [d.raw_data["target_id"] for d in sim.simulate_frame(datetime.utcnow())] == [1]
+    
+    def test_snr_batch_is_double_precision(self):
+        config = RadarConfig(
+            id="TEST_FMCW",
+            type=RadarType.FMCW,
+            location=[0, 0, 10],
+            frequency_ghz=77,
+            metadata={"frequency_ghz": 77, "bandwidth_mhz": 4000}
+        )
+        sim = FMCWRadarSimulator(config)
+        
+        # Simulator scratch buffers are float32; the reported SNR must not be
+        snr_db = sim.calculate_snr_batch(
+            np.array([1234.5], dtype=np.float32), np.array([10.0], dtype=np.float32)
+        )
+        assert snr_db.dtype == np.float64
 
 
 class TestPulseDopplerSimulator:
@@ -201,3 +375,34 @@ class TestAESASimulator:
         # Off-axis gain should be lower
         gain_off = sim.calculate_beam_gain(10, 10)
         assert gain_off < 0
+        
+        # Batch gains match the scalar ones, floor included
+        target_az = np.array([0.0, 10.0, 90.0])
+        target_el = np.array([0.0, 10.0, 0.0])
+        gains = sim.calculate_beam_gain_batch(target_az, target_el, np.zeros(3))
+        assert np.allclose(gains, [sim.calculate_beam_gain(a, e) for a, e in zip(target_az, target_el)])
+        assert gains[2] == -40
+    
+    def test_scan_beam_matches_stepping(self):
+        config = RadarConfig(
+            id="TEST_AESA",
+            type=RadarType.AESA,
+            location=[0, 0, 20],
+            frequency_ghz=35,
+            metadata={"frequency_ghz": 35, "elements": 1024}
+        )
+        
+        sim = AESARadarSimulator(config)
+        sim.steer_beam(42.5, 0)
+        schedule = sim.scan_beam(60)
+        
+        # Reference: advance 5 degrees per detection, restart at -60 past +60
+        beam, expected = 42.5, []
+        for _ in range(60):
+            expected.append(beam)
+            beam += 5
+            if beam > 60:
+                beam = -60
+        
+        assert np.allclose(schedule, expected)
+        assert sim.beam_azimuth == beam
@@ -2,12 +2,27 @@
 Tests for tracker
 """
 import pytest
+import time
 from datetime import datetime, timedelta
 
 from radix.models.schemas import NormalizedRadarData, TrackState
 from radix.core.tracker import SimpleTracker
 
 
+def make_detection(x):
+    """Stationary RADAR_A detection at ENU position (x, 0, 100)"""
+    return NormalizedRadarData(
+        timestamp=datetime.utcnow(),
+        sensor_id="RADAR_A",
+        range_m=1000.0,
+        azimuth_deg=45.0,
+        doppler_mps=-10.0,
+        snr_db=20.0,
+        position_enu=[x, 0.0, 100.0],
+        velocity_enu=[0.0, 0.0, 0.0]
+    )
+
+
 class TestSimpleTracker:
     """Test SimpleTracker"""
     
@@ -126,6 +141,36 @@ class TestSimpleTracker:
         # Track should still exist but coasting
         assert len(tracks) > 0
     
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_coasting_ignores_local_dst(self, monkeypatch):
+        # Naive UTC timestamps an hour apart that straddle a local DST change
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            tracker = SimpleTracker(max_coast_time=5.0)
+            first = datetime(2026, 3, 8, 1, 59, 59)
+            frames = [
+                (first, [0.0, 0.0, 0.0]),
+                (first + timedelta(hours=1, seconds=2), [5000.0, 0.0, 0.0])
+            ]
+            for timestamp, position in frames:
+                tracks = tracker.update([NormalizedRadarData(
+                    timestamp=timestamp,
+                    sensor_id="RADAR_A",
+                    range_m=1000.0,
+                    azimuth_deg=0.0,
+                    doppler_mps=0.0,
+                    snr_db=20.0,
+                    position_enu=position,
+                    velocity_enu=[0.0, 0.0, 0.0]
+                )])
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        
+        # The first track has not been updated for an hour and is dropped
+        assert [t.track_id for t in tracks] == [2]
+    
     def test_get_active_tracks(self):
         tracker = SimpleTracker()
         
@@ -171,3 +216,48 @@ class TestSimpleTracker:
         # Non-existent track
         track = tracker.get_track_by_id(999)
         assert track is None
+    
+    def test_association_gate(self):
+        tracker = SimpleTracker(max_association_distance=100.0)
+        
+        tracker.update([make_detection(0.0)])
+        
+        # Nearest detection inside the gate updates the track, the other starts a new one
+        tracker.update([make_detection(150.0), make_detection(40.0)])
+        
+        assert len(tracker.tracks) == 2
+        assert tracker.get_track_by_id(1).state_vector[0] == 40.0
+        assert tracker.get_track_by_id(2).state_vector[0] == 150.0
+    
+    def test_assignment_is_global(self):
+        tracker = SimpleTracker(max_association_distance=100.0)
+        
+        tracker.update([make_detection(0.0), make_detection(90.0)])
+        
+        # Track 1 is closest to 45, but taking it would leave track 2 unmatched
+        tracker.update([make_detection(45.0), make_detection(-90.0)])
+        
+        assert len(tracker.tracks) == 2
+        assert tracker.get_track_by_id(1).state_vector[0] == -90.0
+        assert tracker.get_track_by_id(2).state_vector[0] == 45.0
+    
+    def test_track_history_is_bounded(self):
+        tracker = SimpleTracker()
+        
+        for i in range(60):
+            det = NormalizedRadarData(
+                timestamp=datetime.utcnow(),
+                sensor_id="RADAR_A",
+                target_id=i,
+                range_m=1000.0,
+                azimuth_deg=45.0,
+                doppler_mps=-10.0,
+                snr_db=20.0,
+                position_enu=[707.0, 707.0, 100.0],
+                velocity_enu=[-7.0, -7.0, 0.0]
+            )
+            tracker.update([det])
+        
+        track = tracker.get_track_by_id(1)
+        assert len(track.detections) == 50
+        assert track.detections[-1].target_id == 59